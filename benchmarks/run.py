@@ -0,0 +1,337 @@
+"""Benchmarks of the stages of a call, against the local stub server:
+
+    python -m benchmarks.run                  # Run and compare with benchmarks/baseline.json
+    python -m benchmarks.run --save           # Run and store the results as new baseline
+    python -m benchmarks.run --filter hydrate # Only run the benchmarks containing 'hydrate'
+
+Every benchmark reports the seconds per operation (the best of several repeats). A benchmark slower than the baseline
+by more than the tolerance is a regression, and the exit code is 1."""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+import toornament
+from toornament.json_decoder import BACKENDS, get_decoder
+from toornament.stub_server import StubServer, StubData
+from toornament.viewer_api import VIEWER_ENDPOINTS
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+SIZES = (10, 128, 1024)
+"""The numbers of items of the payloads."""
+
+CONCURRENCY = (1, 4, 16)
+"""The numbers of requests sent at the same time by the asynchron benchmarks."""
+
+REQUESTS = 64
+"""The number of requests of every transport benchmark."""
+
+SCHEMAS = {
+    'Match': 'get_matches_from_tournament',
+    'MatchDetailed': 'get_match',
+    'BracketNode': 'get_bracket_nodes',
+    'RankingItem': 'get_ranking_items',
+    'Tournament': 'get_tournaments_featured',
+}
+"""The schemas whose construction is measured, and the method returning them."""
+
+_ENDPOINTS = {endpoint.name: endpoint for endpoint in VIEWER_ENDPOINTS}
+
+
+def measure(function, repeat=5):
+    """:returns The best seconds per call of `function` of `repeat` runs."""
+
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+
+    return min(timer.repeat(repeat = repeat, number = number)) / number
+
+
+class Results(dict):
+
+    def __init__(self, selected=None):
+        """The seconds per operation of the benchmarks by name.
+        :param selected Only run the benchmarks whose name contains this string."""
+
+        super().__init__()
+        self.selected = selected
+
+    def wants(self, name):
+        return not self.selected or self.selected in name
+
+    def measure(self, name, function, repeat=5, operations=1):
+        """Measures `function` if the benchmark `name` is selected.
+        :param operations The number of operations of one call of `function`."""
+
+        if self.wants(name):
+            self[name] = measure(function, repeat) / operations
+
+
+def _data(size):
+    """:returns StubData with a tournament of about `size` matches and participants."""
+
+    return StubData(tournaments = 1, participants = size)
+
+
+def _records(data, schema):
+    tournament_id = data.tournament_ids[0]
+    stage_id = data.stages[tournament_id][0]['id']
+    name = SCHEMAS[schema]
+
+    parameters = {'tournament_id': tournament_id, 'stage_id': stage_id}
+
+    if schema == 'MatchDetailed':
+        records = [data.resolve(name, dict(parameters, id = match['id'])) for match in data.matches[tournament_id]]
+    else:
+        records = data.resolve(name, parameters)
+
+    return [{key: value for key, value in record.items() if not key.startswith('_')} for record in records]
+
+
+class _Connector(toornament.SyncViewerAPI):
+    """A connector answering every request with the same content, to measure the methods without the transport."""
+
+    content = []
+
+    def _request(self, method, path, *, path_parameters, query_parameters, headers):
+        return self.content, {'Content-Range': 'matches 0-127/1000'}
+
+
+def _value(parameter):
+    """:returns A value of the type of a Query parameter."""
+
+    if parameter.type is list:
+        return [1, 2] if parameter.ids else ['completed', 'pending']
+
+    if parameter.type is bool:
+        return True
+
+    if parameter.type is int:
+        return 1
+
+    return 'value'
+
+
+def _arguments(endpoint, filtered):
+    """:param filtered Whether to pass all query parameters, or only the required ones.
+    :returns The positional and keyword arguments of a call of the method of `endpoint`."""
+
+    arguments = [1] * len(endpoint.path_names)
+    keywords = {parameter.name: _value(parameter) for parameter in endpoint.query if filtered or parameter.required}
+
+    if endpoint.ranged:
+        keywords['range'] = toornament.Range(0, endpoint.max_range - 1)
+
+    return arguments, keywords
+
+
+def bench_request_building(results):
+    """Measures every method of VIEWER_ENDPOINTS, and once more with all query parameters if it takes optional ones."""
+
+    connector = _Connector('key', raw = True)
+
+    for endpoint in VIEWER_ENDPOINTS:
+        method = getattr(connector, endpoint.name)
+        variants = [('', False)]
+
+        if any(not parameter.required for parameter in endpoint.query):
+            variants.append(('_filtered', True))
+
+        for suffix, filtered in variants:
+            arguments, keywords = _arguments(endpoint, filtered)
+
+            results.measure('request_building/{}{}'.format(endpoint.name, suffix),
+                            lambda: method(*arguments, **keywords))
+
+
+def bench_decode(results):
+    for size in SIZES:
+        body = json.dumps(_records(_data(size), 'Match')).encode()
+
+        for backend in BACKENDS:
+            try:
+                decode = get_decoder(backend)
+            except ImportError:
+                continue
+
+            results.measure('decode/{}/{}'.format(backend, size), lambda: decode(body))
+
+
+def bench_hydrate(results):
+    for size in SIZES:
+        data = _data(size)
+
+        for schema, name in SCHEMAS.items():
+            records = _records(data, schema)
+            records = (records * (size // len(records) + 1))[:size]
+            build = _ENDPOINTS[name].schema
+            lazy = toornament.Hydration(lazy = True)
+
+            def eagerly():
+                return [build(**record) for record in records]
+
+            def lazily():
+                with lazy:
+                    return [build(**record) for record in records]
+
+            results.measure('hydrate/{}/{}'.format(schema, size), eagerly)
+            results.measure('hydrate_lazy/{}/{}'.format(schema, size), lazily)
+
+
+def bench_sync_transport(results, base_url, data):
+    tournament_id = data.tournament_ids[0]
+    match_id = data.matches[tournament_id][0]['id']
+
+    with toornament.SyncViewerAPI('key', base_url = base_url, raw = True) as connector:
+        def requests():
+            for _ in range(REQUESTS):
+                connector.get_match(tournament_id, match_id)
+
+        results.measure('transport/sync/get_match', requests, 3, REQUESTS)
+
+        def pages():
+            for _ in range(REQUESTS // 8):
+                connector.get_matches_from_tournament(tournament_id, range = toornament.Range(0, 127))
+
+        results.measure('transport/sync/get_matches_from_tournament', pages, 3, REQUESTS // 8)
+
+    cache = toornament.ResponseCache(default_ttl = 0)
+
+    with toornament.SyncViewerAPI('key', base_url = base_url, raw = True, cache = cache) as connector:
+        def revalidations():
+            for _ in range(REQUESTS):
+                connector.get_match(tournament_id, match_id)
+
+        results.measure('transport/sync/get_match_revalidated', revalidations, 3, REQUESTS)
+
+
+async def bench_async_transport(results, base_url, data):
+    tournament_id = data.tournament_ids[0]
+    match_id = data.matches[tournament_id][0]['id']
+
+    async with toornament.AsyncViewerAPI('key', base_url = base_url, raw = True, coalesce_requests = False) as connector:
+        for concurrency in CONCURRENCY:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def request():
+                async with semaphore:
+                    await connector.get_match(tournament_id, match_id)
+
+            name = 'transport/async/get_match/concurrency={}'.format(concurrency)
+            if results.wants(name):
+                timings = []
+
+                for _ in range(3):
+                    start = time.perf_counter()
+                    await asyncio.gather(*[request() for _ in range(REQUESTS)])
+                    timings.append((time.perf_counter() - start) / REQUESTS)
+
+                results[name] = min(timings)
+
+            name = 'transport/async/iter_matches/concurrency={}'.format(concurrency)
+            if results.wants(name):
+                start = time.perf_counter()
+                count = 0
+
+                async for _ in connector.iter_matches_from_tournament(tournament_id, concurrency = concurrency):
+                    count += 1
+
+                results[name] = (time.perf_counter() - start) / count
+
+
+def run(selected=None):
+    """:param selected Only run the benchmarks whose name contains this string.
+    :returns The Results."""
+
+    results = Results(selected)
+
+    bench_request_building(results)
+    bench_decode(results)
+    bench_hydrate(results)
+
+    server = StubServer(_data(max(SIZES)), validators = True)
+
+    with server.running() as base_url:
+        bench_sync_transport(results, base_url, server.data)
+
+    async def transport():
+        base_url = await server.start()
+
+        try:
+            await bench_async_transport(results, base_url, server.data)
+        finally:
+            await server.stop()
+
+    asyncio.run(transport())
+
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Prints the results next to the baseline.
+    :returns The names of the benchmarks slower than the baseline by more than `tolerance`."""
+
+    regressions = []
+
+    print('{:<60} {:>12} {:>12} {:>8}'.format('benchmark', 'seconds', 'baseline', 'ratio'))
+
+    for name, value in sorted(results.items()):
+        reference = baseline.get(name)
+        ratio = value / reference if reference else None
+
+        flag = ''
+        if ratio is not None and ratio > 1 + tolerance:
+            regressions.append(name)
+            flag = '  REGRESSION'
+
+        print('{:<60} {:>12.3e} {:>12} {:>8}{}'.format(
+            name, value, '{:.3e}'.format(reference) if reference else '-', '{:.2f}'.format(ratio) if ratio else '-',
+            flag))
+
+    return regressions
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description = 'Benchmarks of toornament against the local stub server.')
+    parser.add_argument('--baseline', default = BASELINE, help = 'The JSON file of the baseline.')
+    parser.add_argument('--save', action = 'store_true', help = 'Store the results as baseline.')
+    parser.add_argument('--tolerance', type = float, default = 0.25,
+                        help = 'The share a benchmark may be slower than the baseline. Defaults to 0.25.')
+    parser.add_argument('--filter', help = 'Only run the benchmarks containing this string.')
+    options = parser.parse_args(arguments)
+
+    results = run(options.filter)
+
+    baseline = {}
+    if os.path.exists(options.baseline):
+        with open(options.baseline) as file:
+            baseline = json.load(file)['results']
+
+    regressions = compare(results, baseline, options.tolerance)
+
+    if options.save:
+        with open(options.baseline, 'w') as file:
+            json.dump({
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'results': dict(baseline, **results) if options.filter else results,
+            }, file, indent = 2, sort_keys = True)
+            file.write('\n')
+
+        print('Saved the baseline to {}'.format(options.baseline))
+        return 0
+
+    if regressions:
+        print('{} regression(s) beyond {:.0%}.'.format(len(regressions), options.tolerance))
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -18,5 +18,7 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.6', install_requires = ['requests', 'aiohttp']
+    python_requires='>=3.6', install_requires = ['requests', 'aiohttp'],
+    extras_require = {'orjson': ['orjson'], 'ujson': ['ujson'], 'numpy': ['numpy'],
+                      'parquet': ['pyarrow']}
 )
@@ -0,0 +1,2 @@
+# full_test.py runs against the live API and needs a TOKEN in tests/local_file.py. It is run by hand.
+collect_ignore = ['full_test.py']
@@ -87,6 +87,9 @@ def sync_test():
     res = t.get_tournaments_by_playlist(4092769699448848384, range = toornament.Range(0, 2))
     print(res)
 
+    res = list(t.iter_participants(1755617972580818944))
+    print(res)
+
     print(toornament.Information.fetch_platforms())
 
 
@@ -174,6 +177,9 @@ async def async_test():
     res = await t.get_tournaments_by_playlist(4092769699448848384, range = toornament.Range(0, 2))
     print(res)
 
+    res = [participant async for participant in t.iter_participants(1755617972580818944)]
+    print(res)
+
 # Test Sync Access
 sync_test()
 
@@ -0,0 +1,111 @@
+"""Tests of MatchTable, with and without NumPy."""
+
+import pytest
+from toornament import columnar
+from toornament.columnar import MatchTable, NULL_ID
+from toornament.stub_server import StubData
+
+
+@pytest.fixture(scope = 'module')
+def matches():
+    data = StubData(tournaments = 1, participants = 40)
+    matches = [{key: value for key, value in match.items() if not key.startswith('_')}
+               for match in data.matches[data.tournament_ids[0]]]
+
+    # Matches with other numbers of opponents than two, to check the opponent offsets, and a missing id.
+    matches[3] = dict(matches[3], opponents = None, group_id = None)
+    matches[5] = dict(matches[5], opponents = matches[5]['opponents'][:1])
+
+    return matches
+
+
+@pytest.fixture(params = ['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(columnar, '_numpy', lambda: None)
+
+    return request.param
+
+
+def ids(table):
+    return list(table.columns['id'])
+
+
+def opponents(table):
+    return [[table.opponent_columns['participant_id'][index]
+             for index in range(table.opponent_offsets[match], table.opponent_offsets[match + 1])]
+            for match in range(len(table))]
+
+
+def participant_ids(match):
+    return [int(opponent['participant']['id']) if opponent.get('participant') else NULL_ID
+            for opponent in match['opponents'] or ()]
+
+
+def test_where(matches, backend):
+    table = MatchTable.from_matches(matches)
+    stage_id = matches[0]['stage_id']
+
+    selected = table.where(stage_id = stage_id, status = ('completed', 'running'))
+    expected = [match for match in matches
+                if match['stage_id'] == stage_id and match['status'] in ('completed', 'running')]
+
+    assert expected and ids(selected) == [int(match['id']) for match in expected]
+    assert opponents(selected) == [participant_ids(match) for match in expected]
+    assert ids(table.where(stage_id = int(stage_id), status = ['completed', 'running'])) == ids(selected)
+    assert len(table.where(status = 'unknown')) == 0
+    assert ids(table.where(group_id = None)) == [int(matches[3]['id'])]
+
+    with pytest.raises(KeyError):
+        table.where(name = 'x')
+
+
+def test_group_by(matches, backend):
+    table = MatchTable.from_matches(matches)
+
+    groups = table.group_by('round_id')
+
+    assert list(groups) == sorted({int(match['round_id']) for match in matches})
+    for round_id, group in groups.items():
+        assert ids(group) == [int(match['id']) for match in matches if int(match['round_id']) == round_id]
+
+    statuses = table.group_by('status')
+
+    assert list(statuses) == list(dict.fromkeys(match['status'] for match in matches))
+    assert sum(len(group) for group in statuses.values()) == len(matches)
+
+
+def test_take(matches, backend):
+    table = MatchTable.from_matches(matches)
+    indices = [5, 3, 0, 5, len(matches) - 1]
+
+    taken = table.take(indices)
+
+    assert ids(taken) == [int(matches[index]['id']) for index in indices]
+    assert opponents(taken) == [participant_ids(matches[index]) for index in indices]
+    assert list(taken.opponent_offsets) == [0, 1, 1, 3, 4, 6]
+    assert taken.categories is table.categories
+    assert len(table.take([])) == 0 and list(table.take([]).opponent_offsets) == [0]
+
+
+def test_append_after_to_numpy(matches):
+    pytest.importorskip('numpy')
+
+    table = MatchTable.from_matches(matches[:10])
+    columns, opponent_columns = table.to_numpy()
+
+    table.extend(matches[10:])
+
+    assert len(table) == len(matches)
+    assert columns['id'].tolist() == [int(match['id']) for match in matches[:10]]
+    assert len(opponent_columns['participant_id']) == sum(len(participant_ids(match)) for match in matches[:10])
+    assert opponents(table) == [participant_ids(match) for match in matches]
+
+
+def test_to_numpy_without_numpy(matches, monkeypatch):
+    monkeypatch.setattr(columnar, '_numpy', lambda: None)
+
+    with pytest.raises(ImportError):
+        MatchTable.from_matches(matches).to_numpy()
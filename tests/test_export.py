@@ -0,0 +1,108 @@
+"""Tests of exporting records to CSV, NDJSON and Parquet."""
+
+import asyncio
+import csv
+import json
+from datetime import datetime, timezone
+import pytest
+from toornament.export import COLUMNS, export, export_async, open_writer
+from toornament.stub_server import StubData
+
+
+@pytest.fixture(scope = 'module')
+def matches():
+    data = StubData(tournaments = 1, participants = 40)
+    matches = [{key: value for key, value in match.items() if not key.startswith('_')}
+               for match in data.matches[data.tournament_ids[0]]]
+
+    # A timestamp with another offset than UTC, and missing values.
+    matches[0] = dict(matches[0], scheduled_datetime = '2020-06-08T20:00:00+02:00')
+    matches[1] = dict(matches[1], group_id = None, opponents = None)
+
+    return matches
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def iterate(records):
+    for record in records:
+        yield record
+
+
+def test_csv(matches, tmp_path):
+    path = tmp_path / 'matches.csv'
+
+    assert export(matches, str(path), 'matches', batch_size = 10) == len(matches)
+
+    with open(str(path), newline = '', encoding = 'utf-8') as file:
+        rows = list(csv.DictReader(file))
+
+    assert list(rows[0]) == [name for name, _, _ in COLUMNS['matches']]
+    assert [row['id'] for row in rows] == [match['id'] for match in matches]
+    assert rows[0]['scheduled_datetime'] == '2020-06-08T20:00:00+02:00'
+    assert (rows[1]['group_id'], rows[1]['opponents']) == ('', '')
+    assert json.loads(rows[2]['opponents']) == matches[2]['opponents']
+
+
+def test_ndjson(matches, tmp_path):
+    path = tmp_path / 'matches.jsonl'
+
+    assert export(matches, str(path), 'matches', batch_size = 10) == len(matches)
+
+    with open(str(path), encoding = 'utf-8') as file:
+        assert [json.loads(line) for line in file] == matches
+
+
+def test_parquet(matches, tmp_path):
+    pyarrow = pytest.importorskip('pyarrow')
+    import pyarrow.parquet
+    path = tmp_path / 'matches.parquet'
+
+    assert export(matches, str(path), 'matches', batch_size = 10) == len(matches)
+
+    file = pyarrow.parquet.ParquetFile(str(path))
+    table = file.read()
+
+    assert file.metadata.num_row_groups == (len(matches) + 9) // 10
+    assert table.num_rows == len(matches)
+    assert table.schema.field('id').type == pyarrow.int64()
+    assert table.schema.field('played_at').type == pyarrow.timestamp('us', tz = 'UTC')
+    assert table.schema.field('opponents').type == pyarrow.string()
+
+    rows = table.to_pylist()
+
+    assert [row['id'] for row in rows] == [int(match['id']) for match in matches]
+    assert rows[0]['scheduled_datetime'] == datetime(2020, 6, 8, 18, tzinfo = timezone.utc)
+    assert (rows[1]['group_id'], rows[1]['opponents']) == (None, None)
+    assert json.loads(rows[2]['opponents']) == matches[2]['opponents']
+
+
+@pytest.mark.parametrize('extension', ['csv', 'ndjson', 'parquet'])
+def test_export_async(matches, tmp_path, extension):
+    if extension == 'parquet':
+        pytest.importorskip('pyarrow')
+
+    expected, path = tmp_path / ('expected.' + extension), tmp_path / ('matches.' + extension)
+
+    export(matches, str(expected), 'matches', batch_size = 10)
+
+    assert run(export_async(iterate(matches), str(path), 'matches', batch_size = 10)) == len(matches)
+    assert path.read_bytes() == expected.read_bytes()
+
+
+def test_open_writer_errors(tmp_path):
+    with pytest.raises(ValueError):
+        open_writer(str(tmp_path / 'matches.txt'), 'matches')
+
+    with pytest.raises(ValueError):
+        open_writer(str(tmp_path / 'matches.csv'), 'matches', 'xml')
+
+    with pytest.raises(ValueError):
+        open_writer(str(tmp_path / 'matches.csv'), 'brackets')
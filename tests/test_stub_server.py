@@ -0,0 +1,306 @@
+"""Tests of the connectors against the local stub server, without token or network."""
+
+import asyncio
+import gc
+import warnings
+import aiohttp
+import pytest
+import requests
+import toornament
+from toornament.stub_server import StubServer, StubData
+
+
+def run(coroutine):
+    # Like asyncio.run(), which is not available in Python 3.6.
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def no_backoff(max_attempts=5):
+    return toornament.RetryPolicy(max_attempts = max_attempts, backoff_base = 0, jitter = 0)
+
+
+@pytest.fixture(scope = 'module')
+def data():
+    return StubData(tournaments = 1, participants = 150)
+
+
+@pytest.fixture(scope = 'module')
+def tournament_id(data):
+    return data.tournament_ids[0]
+
+
+@pytest.fixture(scope = 'module')
+def server(data):
+    server = StubServer(data)
+
+    with server.running() as base_url:
+        server.base_url = base_url
+        yield server
+
+
+def match_ids(data, tournament_id):
+    return [int(match['id']) for match in data.matches[tournament_id]]
+
+
+def test_range_and_page(server, tournament_id):
+    connector = toornament.SyncViewerAPI('key', base_url = server.base_url)
+
+    page = connector.get_matches_from_tournament(tournament_id, range = toornament.Range(10, 19))
+
+    assert isinstance(page, toornament.Page)
+    assert len(page) == 10
+    assert (page.unit, page.start, page.end, page.total) == ('matches', 10, 19, len(server.data.matches[tournament_id]))
+    assert page.has_more and not page.is_truncated
+    assert (page.next_range().start, page.next_range().end) == (20, 29)
+    assert all(isinstance(match, toornament.Match) for match in page)
+
+
+def test_range_and_page_async(server, tournament_id):
+    async def get():
+        async with toornament.AsyncViewerAPI('key', base_url = server.base_url) as connector:
+            return await connector.get_matches_from_tournament(tournament_id, range = toornament.Range(0, 9), raw = True)
+
+    page = run(get())
+
+    assert (page.start, page.end, len(page)) == (0, 9, 10)
+    assert [int(match['id']) for match in page] == match_ids(server.data, tournament_id)[:10]
+
+
+def test_last_page(server, tournament_id):
+    connector = toornament.SyncViewerAPI('key', base_url = server.base_url)
+    total = len(server.data.matches[tournament_id])
+
+    page = connector.get_matches_from_tournament(tournament_id, range = toornament.Range(total - 5, total + 50))
+
+    assert len(page) == 5
+    assert not page.has_more and not page.is_truncated
+    assert page.next_range() is None
+
+
+def test_iter(server, data, tournament_id):
+    connector = toornament.SyncViewerAPI('key', base_url = server.base_url)
+
+    assert [match.id for match in connector.iter_matches_from_tournament(tournament_id)] == match_ids(data, tournament_id)
+
+
+@pytest.mark.parametrize('concurrency', [1, 4])
+def test_iter_async(server, data, tournament_id, concurrency):
+    async def collect():
+        async with toornament.AsyncViewerAPI('key', base_url = server.base_url) as connector:
+            return [match.id async for match in connector.iter_matches_from_tournament(tournament_id,
+                                                                                        concurrency = concurrency)]
+
+    assert run(collect()) == match_ids(data, tournament_id)
+
+
+@pytest.mark.parametrize('concurrency', [1, 4])
+def test_iter_truncated_pages(data, tournament_id, concurrency):
+    server = StubServer(data, page_size = 100)
+
+    with server.running() as base_url:
+        connector = toornament.SyncViewerAPI('key', base_url = base_url)
+        page = connector.get_matches_from_tournament(tournament_id, range = toornament.Range(0, 127))
+
+        assert len(page) == 100 and page.is_truncated
+        assert [match.id for match in connector.iter_matches_from_tournament(tournament_id)] == \
+            match_ids(data, tournament_id)
+
+        async def collect():
+            async with toornament.AsyncViewerAPI('key', base_url = base_url) as connector:
+                return [match.id async for match in connector.iter_matches_from_tournament(tournament_id,
+                                                                                            concurrency = concurrency)]
+
+        assert run(collect()) == match_ids(data, tournament_id)
+
+
+def test_throttled_without_retries(data, tournament_id):
+    server = StubServer(data, throttle_every = 1, retry_after = 0)
+
+    with server.running() as base_url:
+        with pytest.raises(requests.HTTPError):
+            toornament.SyncViewerAPI('key', base_url = base_url).get_tournament(tournament_id)
+
+        async def get():
+            async with toornament.AsyncViewerAPI('key', base_url = base_url) as connector:
+                await connector.get_tournament(tournament_id)
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            run(get())
+
+
+def test_throttled_retries(data, tournament_id):
+    server = StubServer(data, throttle_every = 3, retry_after = 0)
+
+    with server.running() as base_url:
+        connector = toornament.SyncViewerAPI('key', base_url = base_url, retry_policy = no_backoff(),
+                                             rate_limiter = toornament.RateLimiter(1000))
+
+        for _ in range(6):
+            assert connector.get_tournament(tournament_id).id == int(tournament_id)
+
+        async def get():
+            async with toornament.AsyncViewerAPI('key', base_url = base_url, retry_policy = no_backoff(),
+                                                 rate_limiter = toornament.RateLimiter(1000),
+                                                 coalesce_requests = False) as connector:
+                return await asyncio.gather(*[connector.get_tournament(tournament_id) for _ in range(6)])
+
+        assert all(tournament.id == int(tournament_id) for tournament in run(get()))
+
+    assert server.throttled >= 4
+
+
+def test_retry_hooks(data, tournament_id):
+    server = StubServer(data, throttle_every = 2, retry_after = 0)
+    retries = []
+
+    policy = no_backoff()
+    policy.add_hook(lambda **kwargs: retries.append(kwargs['status']))
+
+    with server.running() as base_url:
+        connector = toornament.SyncViewerAPI('key', base_url = base_url, retry_policy = policy)
+        connector.get_tournament(tournament_id)
+        connector.get_tournament(tournament_id)
+
+    assert retries == [429]
+
+
+def test_cache(data, tournament_id):
+    server = StubServer(data)
+
+    with server.running() as base_url:
+        connector = toornament.SyncViewerAPI('key', base_url = base_url, cache = toornament.ResponseCache(60))
+
+        first = connector.get_tournament(tournament_id, raw = True)
+        second = connector.get_tournament(tournament_id, raw = True)
+        page = connector.get_matches_from_tournament(tournament_id, range = toornament.Range(0, 9))
+        connector.get_matches_from_tournament(tournament_id, range = toornament.Range(0, 9))
+        connector.get_matches_from_tournament(tournament_id, range = toornament.Range(10, 19))
+
+        assert first == second
+        assert page.total == len(data.matches[tournament_id])
+        assert server.requests == 3
+
+
+def test_cache_revalidation(data, tournament_id):
+    server = StubServer(data, validators = True)
+
+    with server.running() as base_url:
+        events = []
+        connector = toornament.SyncViewerAPI('key', base_url = base_url, cache = toornament.ResponseCache(0),
+                                             on_request = [events.append])
+
+        first = connector.get_tournament(tournament_id, raw = True)
+        second = connector.get_tournament(tournament_id, raw = True)
+        page = connector.get_matches_from_tournament(tournament_id, range = toornament.Range(0, 9))
+        again = connector.get_matches_from_tournament(tournament_id, range = toornament.Range(0, 9))
+
+        assert first == second
+        assert list(page) and [match.id for match in page] == [match.id for match in again]
+        assert (again.start, again.end) == (0, 9)
+        assert server.not_modified == 2
+        assert [event.cache for event in events] == ['miss', 'revalidated', 'miss', 'revalidated']
+
+        async def get():
+            async with toornament.AsyncViewerAPI('key', base_url = base_url,
+                                                 cache = toornament.ResponseCache(0)) as connector:
+                await connector.get_tournament(tournament_id)
+                return await connector.get_tournament(tournament_id)
+
+        assert run(get()).id == int(tournament_id)
+        assert server.not_modified == 3
+
+
+def test_coalescing(data, tournament_id):
+    server = StubServer(data, latency = 0.05)
+
+    with server.running() as base_url:
+        async def get():
+            async with toornament.AsyncViewerAPI('key', base_url = base_url) as connector:
+                return await asyncio.gather(*[connector.get_tournament(tournament_id) for _ in range(5)])
+
+        assert len(run(get())) == 5
+        assert server.requests == 1
+
+
+def test_event_loops(server, tournament_id):
+    with warnings.catch_warnings(record = True) as caught:
+        warnings.simplefilter('always')
+
+        connector = toornament.AsyncViewerAPI('key', base_url = server.base_url)
+
+        for _ in range(2):
+            assert run(connector.get_tournament(tournament_id)).id == int(tournament_id)
+
+        run(connector.aclose())
+
+        # Sessions used in one loop and dropped without aclose() are closed by their loop.
+        for _ in range(2):
+            run(toornament.AsyncViewerAPI('key', base_url = server.base_url).get_tournament(tournament_id))
+
+        del connector
+        gc.collect()
+
+    assert [str(warning.message) for warning in caught if issubclass(warning.category, ResourceWarning)] == []
+
+
+def test_missing_api_key(server, tournament_id):
+    with pytest.raises(requests.HTTPError) as error:
+        toornament.SyncViewerAPI('', base_url = server.base_url).get_tournament(tournament_id)
+
+    assert error.value.response.status_code == 401
+
+
+def test_bracket(server, data, tournament_id):
+    stage_id = data.stages[tournament_id][0]['id']
+    bracket = toornament.Bracket.fetch(toornament.SyncViewerAPI('key', base_url = server.base_url), tournament_id,
+                                       stage_id)
+
+    assert len(bracket) == len(data.bracket_nodes[tournament_id])
+
+    path = bracket.path_to_final(bracket.at_depth(0)[0].id)
+
+    assert [node.depth for node in path] == bracket.depths
+    assert bracket.next_match_of_winner(path[-1].id) is None
+
+
+def test_coalesced_events(data, tournament_id):
+    server = StubServer(data, latency = 0.05)
+    events = []
+    metrics = toornament.MetricsRegistry()
+
+    with server.running() as base_url:
+        async def get():
+            async with toornament.AsyncViewerAPI('key', base_url = base_url, on_request = [events.append],
+                                                 metrics = metrics) as connector:
+                await asyncio.gather(*[connector.get_tournament(tournament_id) for _ in range(3)])
+
+        run(get())
+
+    assert server.requests == 1
+    assert [(event.cache, event.status) for event in events] == [(None, 200), ('coalesced', 200), ('coalesced', 200)]
+    assert all(event.bytes and event.ttfb is not None and event.decode is not None for event in events)
+    assert len({id(event) for event in events}) == 3
+
+    snapshot = metrics.snapshot()['/tournaments/{id}']
+    assert (snapshot['requests'], snapshot['in_flight'], snapshot['errors']) == (3, 0, {})
+
+
+def test_coalesced_errors(data):
+    server = StubServer(data)
+    events = []
+
+    with server.running() as base_url:
+        async def get():
+            async with toornament.AsyncViewerAPI('key', base_url = base_url, on_request = [events.append]) as connector:
+                return await asyncio.gather(*[connector.get_tournament(1) for _ in range(2)], return_exceptions = True)
+
+        errors = run(get())
+
+    assert all(isinstance(error, aiohttp.ClientResponseError) for error in errors)
+    assert [(event.status, type(event.error)) for event in events] == [(404, aiohttp.ClientResponseError)] * 2
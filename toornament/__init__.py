@@ -1,5 +1,14 @@
 from .viewer_api import SyncViewerAPI, AsyncViewerAPI
 from .range import Range
+from .page import Page
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
+from .cache import ResponseCache
+from .hydration import Hydration, IdentityMap
+from .instrumentation import RequestEvent
+from .metrics import MetricsRegistry
+from .columnar import MatchTable
+from .bracket import Bracket
 from .exceptions import ToornamentException
 from .information import Information
 from .viewer_schemas import *
@@ -0,0 +1,152 @@
+from .viewer_schemas import BracketNode
+
+WINNER = 'winner'
+LOSER = 'loser'
+
+
+class Bracket:
+
+    def __init__(self, nodes):
+        """The bracket nodes of a stage, indexed by id, depth, branch and round, with the links between them resolved.
+        An opponent of a node with a `source_node_id` is the winner or the loser (`source_type`) of that node, so the
+        nodes form a graph, which is walked without scanning the nodes:
+
+            bracket = Bracket.fetch(connector, 10000000000000, 20000000000000)
+            for node in bracket.path_to_final(30000000000000):
+                print(node.depth, node.number, node.status)
+
+        Sources outside of the nodes, like nodes of other groups that were not fetched, are ignored.
+        :param nodes An iterable of BracketNodes, or bracket nodes as decoded JSON."""
+
+        self.nodes = {}
+        self._by_depth = {}
+        self._by_branch = {}
+        self._by_round = {}
+        self._predecessors = {}
+        self._successors = {}
+
+        for node in nodes:
+            if not isinstance(node, BracketNode):
+                node = BracketNode(**node)
+
+            self.nodes[node.id] = node
+            self._by_depth.setdefault(node.depth, []).append(node)
+            self._by_branch.setdefault(node.branch, []).append(node)
+            self._by_round.setdefault(node.round_id, []).append(node)
+            self._predecessors[node.id] = []
+            self._successors[node.id] = {}
+
+        for node in self.nodes.values():
+            for opponent in node.opponents or ():
+                source = self.nodes.get(opponent.source_node_id)
+
+                if source is None:
+                    continue
+
+                self._predecessors[node.id].append(source)
+                self._successors[source.id][opponent.source_type] = node
+
+    @classmethod
+    def fetch(cls, connector, tournament_id, stage_id, **filters):
+        """:param connector A SyncViewerAPI.
+        :param filters The filters of `iter_bracket_nodes`, like `group_ids`.
+        :returns A Bracket of all bracket nodes of the stage."""
+
+        return cls(connector.iter_bracket_nodes(tournament_id, stage_id, raw = False, **filters))
+
+    @classmethod
+    async def fetch_async(cls, connector, tournament_id, stage_id, *, concurrency=1, **filters):
+        """:param connector An AsyncViewerAPI.
+        :param concurrency The maximal number of pages requested at the same time.
+        :param filters The filters of `iter_bracket_nodes`, like `group_ids`.
+        :returns A Bracket of all bracket nodes of the stage."""
+
+        return cls([node async for node in connector.iter_bracket_nodes(tournament_id, stage_id, raw = False,
+                                                                        concurrency = concurrency, **filters)])
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __iter__(self):
+        return iter(self.nodes.values())
+
+    def __contains__(self, node_id):
+        return int(node_id) in self.nodes
+
+    def __getitem__(self, node_id) -> BracketNode:
+        return self.nodes[int(node_id)]
+
+    @property
+    def depths(self):
+        """The depths of the nodes, sorted."""
+
+        return sorted(self._by_depth)
+
+    @property
+    def branches(self):
+        """The branches of the nodes, like 'WB' and 'LB'."""
+
+        return list(self._by_branch)
+
+    def at_depth(self, depth, branch=None):
+        """:param branch Only return the nodes of this branch.
+        :returns The nodes at `depth`, in the order they were fetched."""
+
+        nodes = self._by_depth.get(depth, [])
+
+        if branch is not None:
+            return [node for node in nodes if node.branch == branch]
+
+        return list(nodes)
+
+    def in_branch(self, branch):
+        """:returns The nodes of `branch`, in the order they were fetched."""
+
+        return list(self._by_branch.get(branch, []))
+
+    def in_round(self, round_id):
+        """:returns The nodes of the round, in the order they were fetched."""
+
+        return list(self._by_round.get(int(round_id), []))
+
+    def predecessors(self, node_id):
+        """:returns The nodes the opponents of the node come from, in the order of the opponents.
+        :raises KeyError If the node is not in the bracket."""
+
+        return list(self._predecessors[int(node_id)])
+
+    def successors(self, node_id):
+        """:returns The nodes the winner and the loser of the node go to.
+        :raises KeyError If the node is not in the bracket."""
+
+        return list(self._successors[int(node_id)].values())
+
+    def next_match_of_winner(self, node_id):
+        """:returns The node the winner of the node goes to, or None if there is none.
+        :raises KeyError If the node is not in the bracket."""
+
+        return self._successors[int(node_id)].get(WINNER)
+
+    def next_match_of_loser(self, node_id):
+        """:returns The node the loser of the node goes to, or None if the loser is out.
+        :raises KeyError If the node is not in the bracket."""
+
+        return self._successors[int(node_id)].get(LOSER)
+
+    def path_to_final(self, node_id):
+        """:returns The nodes the winner of the node goes through, starting with the node itself and ending with the
+        last node without a next match for the winner.
+        :raises KeyError If the node is not in the bracket."""
+
+        node = self[node_id]
+        path = [node]
+        seen = {node.id}
+
+        node = self.next_match_of_winner(node.id)
+
+        while node is not None and node.id not in seen:
+            path.append(node)
+            seen.add(node.id)
+            node = self.next_match_of_winner(node.id)
+
+        return path
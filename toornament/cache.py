@@ -0,0 +1,156 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+def request_key(method, path, query_parameters, range_header=None):
+    """:param method The HTTP method.
+    :param path The formatted path of the request.
+    :param query_parameters The query parameters of the request.
+    :param range_header The value of the Range header.
+    :returns A hashable key identifying the request."""
+
+    query = tuple(sorted((name, str(value)) for name, value in query_parameters.items())) if query_parameters else ()
+
+    return method.upper(), path, query, range_header
+
+
+class CacheEntry:
+
+    __slots__ = ('content', 'headers', 'size', 'expires', 'etag', 'last_modified')
+
+    def __init__(self, content, headers, size, expires):
+        self.content = content
+        self.headers = headers
+        self.size = size
+        self.expires = expires
+        self.etag = headers.get('ETag')
+        self.last_modified = headers.get('Last-Modified')
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.expires > time.monotonic()
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> dict:
+        """:returns The headers to revalidate this entry with the API."""
+
+        headers = {}
+
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+
+        return headers
+
+
+class ResponseCache:
+    """A LRU cache for decoded responses, with a time to live per endpoint.
+    Entries are evicted when there are more than `max_entries` or their bodies need more than `max_bytes`.
+    The cached content is shared between all callers and must not be modified.
+
+    If a response had an ETag or Last-Modified header, its entry is kept after it expired. The connection then
+    revalidates it with a conditional request and reuses the content if the API answers 304 Not Modified.
+    Such responses are even stored if their TTL is 0, so they are revalidated on every call."""
+
+    def __init__(self, default_ttl=60.0, ttls=None, max_entries=1024, max_bytes=None):
+        """
+        :param default_ttl Seconds a response is cached if its endpoint has no own TTL. 0 disables caching.
+        :param ttls Dict mapping path templates like '/tournaments/{id}' to the seconds their responses are cached.
+        :param max_entries The maximal number of cached responses.
+        :param max_bytes The maximal sum of the sizes of the cached response bodies. None means no limit.
+        """
+
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls) if ttls else {}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def ttl_for(self, template) -> float:
+        """:returns The TTL for responses of the path template."""
+
+        return self.ttls.get(template, self.default_ttl)
+
+    def get(self, key):
+        """:returns The CacheEntry stored for the key or None if there is none.
+        Expired entries are only returned if they can be revalidated, check `CacheEntry.is_fresh`."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if not entry.is_fresh:
+                self.misses += 1
+
+                if not entry.has_validators:
+                    self._remove(key)
+                    return None
+            else:
+                self.hits += 1
+
+            self._entries.move_to_end(key)
+
+            return entry
+
+    def set(self, key, template, content, headers, size=0):
+        """Stores a response, unless the TTL of its path template is 0 and it can not be revalidated.
+        :param template The path template of the request, used to look up the TTL.
+        :param content The decoded content of the response.
+        :param headers The headers of the response.
+        :param size The size of the response body in bytes."""
+
+        ttl = self.ttl_for(template) or 0
+        entry = CacheEntry(content, headers, size, time.monotonic() + ttl)
+
+        if (not ttl and not entry.has_validators) or (self.max_bytes is not None and size > self.max_bytes):
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = entry
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or (self.max_bytes is not None and self._bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+
+    def revalidated(self, template, entry):
+        """Marks an entry as fresh again, after the API answered 304 Not Modified."""
+
+        with self._lock:
+            entry.expires = time.monotonic() + (self.ttl_for(template) or 0)
+            self.revalidations += 1
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def size(self) -> int:
+        """The sum of the sizes of all cached response bodies in bytes."""
+
+        return self._bytes
+
+    def __len__(self):
+        return len(self._entries)
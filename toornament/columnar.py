@@ -0,0 +1,312 @@
+from array import array
+from functools import lru_cache
+
+NULL = -2 ** 31
+"""The value of missing numbers (scores, ranks...) in the integer columns."""
+
+NULL_ID = -2 ** 63
+"""The value of missing ids in the id columns."""
+
+MATCH_COLUMNS = (
+    ('id', 'q'),
+    ('stage_id', 'q'),
+    ('group_id', 'q'),
+    ('round_id', 'q'),
+    ('number', 'i'),
+    ('status', 'h'),
+    ('type', 'h'),
+)
+
+OPPONENT_COLUMNS = (
+    ('number', 'i'),
+    ('position', 'i'),
+    ('participant_id', 'q'),
+    ('score', 'i'),
+    ('rank', 'i'),
+    ('result', 'h'),
+    ('forfeit', 'b'),
+)
+
+CATEGORICAL_COLUMNS = ('status', 'type', 'result')
+
+
+class Categories:
+
+    __slots__ = ('values', '_codes')
+
+    def __init__(self):
+        """The values of a categorical column. A column stores the index of its value in `values`, or -1 for None."""
+
+        self.values = []
+        self._codes = {}
+
+    def code(self, value, *, add=True):
+        """:param value The value to encode.
+        :param add Whether to add an unknown value. Otherwise, None is returned for it.
+        :returns The code of the value."""
+
+        if value is None:
+            return -1
+
+        code = self._codes.get(value)
+
+        if code is None and add:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+
+        return code
+
+    def __getitem__(self, code):
+        return self.values[code] if code >= 0 else None
+
+
+def _id(value):
+    return int(value) if value else NULL_ID
+
+
+def _number(value):
+    return NULL if value is None else int(value)
+
+
+class MatchTable:
+
+    def __init__(self, categories=None):
+        """Matches stored in columns: a typed array per attribute, instead of an object per match.
+        The matches are added as decoded JSON, for example from an iter_matches_* method with `raw=True`:
+
+            table = MatchTable.from_matches(connector.iter_matches_from_tournament(10000000000000, raw=True))
+            completed = table.where(status='completed')
+            for round_id, matches in completed.group_by('round_id').items():
+                print(round_id, len(matches))
+
+        Ids are stored as 64 bit, numbers as 32 bit integers. Missing values are NULL_ID and NULL.
+        `status`, `type` and `result` are categorical: the columns hold codes, which are decoded with `categories`.
+
+        The opponents of all matches are stored in columns of their own. The opponents of the match at index i are
+        the rows `opponent_offsets[i]` to `opponent_offsets[i + 1]`.
+
+        :param categories The Categories to use for the categorical columns, to share them with other tables."""
+
+        self.columns = {name: array(typecode) for name, typecode in MATCH_COLUMNS}
+        self.opponent_columns = {name: array(typecode) for name, typecode in OPPONENT_COLUMNS}
+        self.opponent_offsets = array('q', [0])
+        self.categories = categories or {name: Categories() for name in CATEGORICAL_COLUMNS}
+        self._exported = False
+
+    @classmethod
+    def from_matches(cls, matches):
+        """:param matches An iterable of matches as decoded JSON.
+        :returns A MatchTable of the matches."""
+
+        table = cls()
+        table.extend(matches)
+
+        return table
+
+    @classmethod
+    async def from_async_matches(cls, matches):
+        """:param matches An asynchron iterable of matches as decoded JSON.
+        :returns A MatchTable of the matches."""
+
+        table = cls()
+
+        async for match in matches:
+            table.append(match)
+
+        return table
+
+    def append(self, match):
+        """:param match A match as decoded JSON."""
+
+        if self._exported:
+            self._detach()
+
+        columns, opponent_columns, categories = self.columns, self.opponent_columns, self.categories
+
+        columns['id'].append(_id(match['id']))
+        columns['stage_id'].append(_id(match.get('stage_id')))
+        columns['group_id'].append(_id(match.get('group_id')))
+        columns['round_id'].append(_id(match.get('round_id')))
+        columns['number'].append(_number(match.get('number')))
+        columns['status'].append(categories['status'].code(match.get('status')))
+        columns['type'].append(categories['type'].code(match.get('type')))
+
+        opponents = match.get('opponents') or ()
+
+        for opponent in opponents:
+            participant = opponent.get('participant')
+
+            opponent_columns['number'].append(_number(opponent.get('number')))
+            opponent_columns['position'].append(_number(opponent.get('position')))
+            opponent_columns['participant_id'].append(_id(participant['id'] if participant else None))
+            opponent_columns['score'].append(_number(opponent.get('score')))
+            opponent_columns['rank'].append(_number(opponent.get('rank')))
+            opponent_columns['result'].append(categories['result'].code(opponent.get('result')))
+            opponent_columns['forfeit'].append(bool(opponent.get('forfeit')))
+
+        self.opponent_offsets.append(self.opponent_offsets[-1] + len(opponents))
+
+    def _detach(self):
+        """Replaces the columns by copies, because an array can not grow while NumPy arrays share its memory."""
+
+        self.columns = {name: _copy(column) for name, column in self.columns.items()}
+        self.opponent_columns = {name: _copy(column) for name, column in self.opponent_columns.items()}
+        self.opponent_offsets = _copy(self.opponent_offsets)
+        self._exported = False
+
+    def extend(self, matches):
+        """:param matches An iterable of matches as decoded JSON, like a Page."""
+
+        for match in matches:
+            self.append(match)
+
+    def __len__(self):
+        return len(self.columns['id'])
+
+    def decode(self, name, code):
+        """:returns The value of a code of the categorical column `name`."""
+
+        return self.categories[name][code]
+
+    def to_numpy(self):
+        """:returns Two dicts of NumPy arrays, for the match and the opponent columns. The arrays share the memory of
+        the columns, so they are not copied. The table copies its columns when matches are added afterwards, and the
+        arrays keep the matches the table had when they were returned.
+        :raises ImportError If NumPy is not installed."""
+
+        if _numpy() is None:
+            raise ImportError('NumPy is required for MatchTable.to_numpy().')
+
+        self._exported = True
+
+        return ({name: _as_numpy(column) for name, column in self.columns.items()},
+                {name: _as_numpy(column) for name, column in self.opponent_columns.items()})
+
+    def where(self, **conditions):
+        """Selects the matches with the given values, like `table.where(stage_id=1, status='completed')`.
+        A condition may also be a tuple, list or set of values. Ids may be given as strings, like in decoded JSON, and
+        None selects missing values.
+        :returns A new MatchTable with the selected matches and their opponents."""
+
+        return self.take(self._select(conditions))
+
+    def group_by(self, name):
+        """:param name The name of a match column, like 'stage_id', 'group_id', 'round_id' or 'status'.
+        :returns A dict of the values of the column and a MatchTable of the matches with the value, sorted by value.
+        Categorical values are decoded, and sorted by their code."""
+
+        numpy = _numpy()
+
+        if numpy is not None:
+            values, inverse = numpy.unique(_as_numpy(self.columns[name]), return_inverse = True)
+            order = numpy.argsort(inverse, kind = 'stable')
+            groups = zip(values.tolist(), numpy.split(order, numpy.cumsum(numpy.bincount(inverse))[:-1]))
+        else:
+            indices_by_value = {}
+
+            for index, value in enumerate(self.columns[name]):
+                indices_by_value.setdefault(value, []).append(index)
+
+            groups = sorted(indices_by_value.items())
+
+        if name in self.categories:
+            return {self.decode(name, code): self.take(indices) for code, indices in groups}
+
+        return {value: self.take(indices) for value, indices in groups}
+
+    def take(self, indices):
+        """:param indices The indices of the matches to select, in order.
+        :returns A new MatchTable with the matches and their opponents. The Categories are shared."""
+
+        table = MatchTable(self.categories)
+        numpy = _numpy()
+
+        if numpy is not None:
+            indices = numpy.asarray(indices, dtype = numpy.int64)
+            offsets = _as_numpy(self.opponent_offsets)
+
+            starts = offsets[indices]
+            counts = offsets[indices + 1] - starts
+            new_offsets = numpy.concatenate(([0], numpy.cumsum(counts)))
+            opponent_indices = numpy.repeat(starts - new_offsets[:-1], counts) + numpy.arange(new_offsets[-1])
+
+            table.opponent_offsets = array('q', new_offsets.astype(numpy.int64).tobytes())
+        else:
+            offsets = self.opponent_offsets
+            opponent_indices = [opponent for index in indices for opponent in range(offsets[index], offsets[index + 1])]
+
+            for index in indices:
+                table.opponent_offsets.append(table.opponent_offsets[-1] + offsets[index + 1] - offsets[index])
+
+        for name, column in self.columns.items():
+            table.columns[name] = _take(column, indices)
+
+        for name, column in self.opponent_columns.items():
+            table.opponent_columns[name] = _take(column, opponent_indices)
+
+        return table
+
+    def _select(self, conditions):
+        codes = {}
+
+        for name, value in conditions.items():
+            if name not in self.columns:
+                raise KeyError('Unknown column: {}'.format(name))
+
+            values = value if isinstance(value, (tuple, list, set, frozenset)) else (value,)
+
+            if name in self.categories:
+                values = [self.categories[name].code(value, add = False) for value in values]
+            elif self.columns[name].typecode == 'q':
+                values = [_id(value) for value in values]
+            else:
+                values = [_number(value) for value in values]
+
+            codes[name] = {value for value in values if value is not None}
+
+        numpy = _numpy()
+
+        if numpy is not None:
+            mask = numpy.ones(len(self), dtype = bool)
+
+            for name, values in codes.items():
+                mask &= numpy.isin(_as_numpy(self.columns[name]), list(values))
+
+            return numpy.flatnonzero(mask)
+
+        indices = range(len(self))
+
+        for name, values in codes.items():
+            column = self.columns[name]
+            indices = [index for index in indices if column[index] in values]
+
+        return list(indices)
+
+
+@lru_cache(maxsize = None)
+def _numpy():
+    """:returns The numpy module, or None if it is not installed. It is imported on first use rather than with the
+    package, as it takes longer to import than the rest of it."""
+
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+
+def _as_numpy(column):
+    numpy = _numpy()
+    return numpy.frombuffer(column, dtype = column.typecode) if len(column) else numpy.empty(0, column.typecode)
+
+
+def _copy(column):
+    return array(column.typecode, column.tobytes())
+
+
+def _take(column, indices):
+    if _numpy() is not None:
+        return array(column.typecode, _as_numpy(column)[indices].tobytes())
+
+    return array(column.typecode, [column[index] for index in indices])
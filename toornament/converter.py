@@ -1,9 +1,76 @@
+import re
+import sys
+import datetime as _datetime
+from functools import lru_cache
+
+_RFC_3339 = re.compile(r'(\d{4})-(\d\d)-(\d\d)[Tt ](\d\d):(\d\d):(\d\d)(?:\.(\d+))?(?:([Zz])|([+-])(\d\d):?(\d\d))?$')
+_DATE = re.compile(r'(\d{4})-(\d\d)-(\d\d)$')
+
+_UTC = _datetime.timezone.utc
+
+
+@lru_cache(maxsize=64)
+def _timezone(sign, hours, minutes):
+    offset = _datetime.timedelta(hours = int(hours), minutes = int(minutes))
+
+    if not offset:
+        return _UTC
+
+    return _datetime.timezone(-offset if sign == '-' else offset)
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(string) -> _datetime.datetime:
+    """:param string A timestamp in RFC 3339 format, like '2020-06-01T18:30:00+02:00'.
+    :returns A timezone-aware datetime. A timestamp without utc offset is taken as UTC.
+    :raises ValueError If the string is no RFC 3339 timestamp."""
+
+    match = _RFC_3339.match(string)
+
+    if match is None:
+        raise ValueError('Invalid RFC 3339 timestamp: {!r}'.format(string))
+
+    year, month, day, hour, minute, second, fraction, utc, sign, offset_hours, offset_minutes = match.groups()
+
+    tzinfo = _UTC if utc or sign is None else _timezone(sign, offset_hours, offset_minutes)
+
+    return _datetime.datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                              int(fraction[:6].ljust(6, '0')) if fraction else 0, tzinfo)
+
+
+@lru_cache(maxsize=1024)
+def parse_date(string) -> _datetime.date:
+    """:param string A date in ISO 8601 format (YYYY-MM-DD).
+    :returns The date.
+    :raises ValueError If the string is no ISO 8601 date."""
+
+    match = _DATE.match(string)
+
+    if match is None:
+        raise ValueError('Invalid ISO 8601 date: {!r}'.format(string))
+
+    return _datetime.date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+
+
 class Converter:
+    """Converts the values of the API. Parsed values are memoized, so the timestamps shared by many objects (like the
+    schedule of a round) are only parsed once. The returned objects are immutable and may be shared.
+
+    Enum-like strings (statuses, types, platforms...) are interned, so that all objects share one string per value. This
+    only saves memory: compare them with `==`, like `match.status == 'completed'`."""
+
+    @staticmethod
+    def symbol(string):
+        return sys.intern(string) if type(string) is str else string
+
+    @staticmethod
+    def symbols(strings):
+        return [sys.intern(string) if type(string) is str else string for string in strings] if strings else strings
 
     @staticmethod
     def datetime(string):
-        return string
+        return parse_datetime(string) if string else None
 
     @staticmethod
     def date(string):
-        return string
+        return parse_date(string) if string else None
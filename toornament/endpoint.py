@@ -0,0 +1,245 @@
+import inspect
+from string import Formatter
+from typing import Optional
+from .page import Page
+from .range import Range
+from .pagination import iterate, async_iterate
+
+RAW_DOC = """
+        :param raw: Whether to return the decoded JSON instead of schema objects. Defaults to the `raw` of the connector."""
+
+
+class Query:
+
+    __slots__ = ('name', 'type', 'ids', 'required')
+
+    def __init__(self, name, type=str, *, ids=False, required=False):
+        """A query parameter of an endpoint.
+        :param name The name of the parameter, used as keyword argument and in the query string.
+        :param type The type of the value, only used for the signature.
+        :param ids Whether the value is a list of ids, which are converted to strings.
+        :param required Whether the parameter has to be given."""
+
+        self.name = name
+        self.type = type
+        self.ids = ids
+        self.required = required
+
+
+class Endpoint:
+
+    def __init__(self, name, path, doc, *, schema, many=False, query=(), unit=None, max_range=None, method='GET'):
+        """Describes an endpoint of the API. The methods of the API classes are generated from it.
+        :param name The name of the generated method.
+        :param path The path of the endpoint. Its fields are the positional arguments of the method.
+        :param doc The docstring of the generated method.
+        :param schema A callable building the returned object from the keywords of one decoded JSON object.
+        :param many Whether the endpoint returns a list of objects.
+        :param query The Query parameters of the endpoint.
+        :param unit The unit of the Range, if the endpoint takes one. The method then returns a Page.
+        :param max_range The maximal size of a Range for the endpoint.
+        :param method The HTTP method."""
+
+        self.name = name
+        self.path = path
+        self.doc = doc
+        self.schema = schema
+        self.many = many or unit is not None
+        self.query = tuple(query)
+        self.unit = unit
+        self.max_range = max_range
+        self.method = method
+
+        self.path_names = tuple(field for _, field, _, _ in Formatter().parse(path) if field)
+
+        self._query_by_name = {parameter.name: parameter for parameter in self.query}
+        self._required = tuple(parameter.name for parameter in self.query if parameter.required)
+
+    @property
+    def ranged(self) -> bool:
+        return self.unit is not None
+
+    def hydrate(self, content, hydration=None):
+        """:param content The decoded JSON of the response.
+        :param hydration The Hydration to build the objects with.
+        :returns The object(s) built from the decoded JSON with the schema of the endpoint."""
+
+        if hydration is not None:
+            with hydration:
+                return self.hydrate(content)
+
+        schema = self.schema
+
+        if self.many:
+            return [schema(**item) for item in content]
+
+        return schema(**content)
+
+    def signature(self, *, ranged=None, extra=()) -> inspect.Signature:
+        """:param ranged Whether to include the `range` parameter. Defaults to whether the endpoint takes one.
+        :param extra Further keyword-only parameters.
+        :returns The signature of the generated method."""
+
+        parameters = [inspect.Parameter('self', inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+
+        parameters += [inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD) for name in self.path_names]
+
+        if self.ranged if ranged is None else ranged:
+            parameters.append(inspect.Parameter('range', inspect.Parameter.KEYWORD_ONLY, annotation = Range))
+
+        for parameter in self.query:
+            if parameter.required:
+                parameters.append(inspect.Parameter(parameter.name, inspect.Parameter.KEYWORD_ONLY,
+                                                    annotation = parameter.type))
+            else:
+                parameters.append(inspect.Parameter(parameter.name, inspect.Parameter.KEYWORD_ONLY, default = None,
+                                                    annotation = Optional[parameter.type]))
+
+        parameters.append(inspect.Parameter('raw', inspect.Parameter.KEYWORD_ONLY, default = None,
+                                            annotation = Optional[bool]))
+
+        parameters += list(extra)
+
+        return inspect.Signature(parameters)
+
+    def source(self, *, asynchronous) -> str:
+        """:returns The source code of the method for the endpoint. Generating it once makes the calls as cheap as
+        hand-written methods, with the signature checked by Python itself."""
+
+        arguments = ['self'] + list(self.path_names)
+        keyword_arguments = ['range'] if self.ranged else []
+        keyword_arguments += [parameter.name if parameter.required else parameter.name + '=None'
+                              for parameter in self.query]
+        keyword_arguments.append('raw=None')
+
+        arguments += ['*'] + keyword_arguments
+
+        lines = ['{}def {}({}):'.format('async ' if asynchronous else '', self.name, ', '.join(arguments))]
+
+        lines.append('    query_parameters = {}')
+        for parameter in self.query:
+            value = '[str(e) for e in {}]'.format(parameter.name) if parameter.ids else parameter.name
+            indent = '    '
+            if not parameter.required:
+                lines.append('    if {}:'.format(parameter.name))
+                indent = '        '
+            lines.append('{}query_parameters[{!r}] = {}'.format(indent, parameter.name, value))
+
+        lines.append('    path_parameters = {{{}}}'.format(
+            ', '.join('{!r}: str({})'.format(name, name) for name in self.path_names)))
+
+        awaiting = 'await ' if asynchronous else ''
+
+        traced = ('        return {}self._traced_access({!r}, {!r}, path_parameters = path_parameters, '
+                  'query_parameters = query_parameters, headers = {}, '
+                  'hydrate = None if (self.raw if raw is None else raw) else hydrate{})')
+
+        if self.ranged:
+            lines += [
+                '    if not range.unit:',
+                '        range.unit = {!r}'.format(self.unit),
+                "    headers = {'Range': range.get_header_value()}",
+                '    if self.on_request or self.metrics is not None:',
+                traced.format(awaiting, self.method, self.path, 'headers', ', range = range'),
+                '    content, content_range = {}self._ranged_access({!r}, {!r}, path_parameters = path_parameters, '
+                'query_parameters = query_parameters, headers = headers)'.format(awaiting, self.method, self.path),
+                '    if self.raw if raw is None else raw:',
+                '        return Page(content, content_range, range)',
+                '    return Page(hydrate(content, self._hydration), content_range, range)',
+            ]
+        else:
+            lines += [
+                '    if self.on_request or self.metrics is not None:',
+                traced.format(awaiting, self.method, self.path, '{}', ''),
+                '    content = {}self._simple_access({!r}, {!r}, path_parameters = path_parameters, '
+                'query_parameters = query_parameters, headers = {{}})'.format(awaiting, self.method, self.path),
+                '    if self.raw if raw is None else raw:',
+                '        return content',
+                '    return hydrate(content, self._hydration)',
+            ]
+
+        return '\n'.join(lines) + '\n'
+
+
+def _describe(function, name, doc, signature):
+    function.__name__ = name
+    function.__doc__ = doc
+    function.__signature__ = signature
+
+    return function
+
+
+def endpoint_method(endpoint: Endpoint, *, asynchronous):
+    """:returns The method (a coroutine function, if `asynchronous`) of an API class for the endpoint."""
+
+    namespace = {'Page': Page, 'hydrate': endpoint.hydrate}
+
+    exec(endpoint.source(asynchronous = asynchronous), namespace)
+
+    return _describe(namespace[endpoint.name], endpoint.name, endpoint.doc + RAW_DOC, endpoint.signature())
+
+
+def _iter_name(endpoint):
+    return 'iter_' + endpoint.name[len('get_'):]
+
+
+def sync_iter_method(endpoint: Endpoint):
+    """:returns A method returning a generator over all items of a ranged endpoint."""
+
+    name, span = endpoint.name, endpoint.max_range
+
+    def iter_access(self, *args, **kwargs):
+        return iterate(getattr(self, name), span, args, kwargs)
+
+    doc = """Generator over all items of `{0}`.
+        Fetches one page of {1} '{2}' after another until the whole collection was read.
+
+        Takes the same arguments as `{0}`, except `range`.""".format(name, span, endpoint.unit) + RAW_DOC
+
+    return _describe(iter_access, _iter_name(endpoint), doc, endpoint.signature(ranged = False))
+
+
+def async_iter_method(endpoint: Endpoint):
+    """:returns A method returning an asynchron generator over all items of a ranged endpoint."""
+
+    name, span = endpoint.name, endpoint.max_range
+
+    def iter_access(self, *args, concurrency=1, **kwargs):
+        return async_iterate(getattr(self, name), span, args, kwargs, concurrency)
+
+    doc = """Asynchron generator over all items of `{0}`.
+        Fetches pages of {1} '{2}' until the whole collection was read.
+        After the first page, up to `concurrency` pages are requested at the same time. The items are yielded in order.
+
+        Takes the same arguments as `{0}`, except `range`.""".format(name, span, endpoint.unit) + RAW_DOC + """
+        :param concurrency: The maximal number of pages requested at the same time."""
+
+    concurrency = inspect.Parameter('concurrency', inspect.Parameter.KEYWORD_ONLY, default = 1, annotation = int)
+
+    return _describe(iter_access, _iter_name(endpoint), doc, endpoint.signature(ranged = False, extra = [concurrency]))
+
+
+def with_endpoints(endpoints, *, asynchronous):
+    """Class decorator adding a method for every Endpoint, and an iter_* method for every ranged one.
+    :param endpoints The Endpoints to add.
+    :param asynchronous Whether the class is an asynchron API class."""
+
+    make_iter_method = async_iter_method if asynchronous else sync_iter_method
+
+    def decorate(cls):
+        cls._endpoints = dict(cls._endpoints, **{endpoint.name: endpoint for endpoint in endpoints})
+
+        for endpoint in endpoints:
+            methods = [endpoint_method(endpoint, asynchronous = asynchronous)]
+
+            if endpoint.ranged:
+                methods.append(make_iter_method(endpoint))
+
+            for method in methods:
+                method.__module__ = cls.__module__
+                method.__qualname__ = '{}.{}'.format(cls.__qualname__, method.__name__)
+                setattr(cls, method.__name__, method)
+
+        return cls
+
+    return decorate
@@ -0,0 +1,292 @@
+from abc import ABCMeta, abstractmethod
+import csv
+import json
+from itertools import islice
+from .converter import Converter
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+ID, INT, STR, DATETIME, JSON = 'id', 'int', 'str', 'datetime', 'json'
+
+_PARTICIPANT_COLUMNS = (
+    ('participant_id', ('participant', 'id'), ID),
+    ('participant_name', ('participant', 'name'), STR),
+)
+
+COLUMNS = {
+    'matches': (
+        ('id', ('id',), ID),
+        ('stage_id', ('stage_id',), ID),
+        ('group_id', ('group_id',), ID),
+        ('round_id', ('round_id',), ID),
+        ('number', ('number',), INT),
+        ('type', ('type',), STR),
+        ('status', ('status',), STR),
+        ('scheduled_datetime', ('scheduled_datetime',), DATETIME),
+        ('played_at', ('played_at',), DATETIME),
+        ('opponents', ('opponents',), JSON),
+    ),
+    'participants': (
+        ('id', ('id',), ID),
+        ('name', ('name',), STR),
+        ('custom_fields', ('custom_fields',), JSON),
+        ('lineup', ('lineup',), JSON),
+    ),
+    'ranking_items': (
+        ('id', ('id',), ID),
+        ('group_id', ('group_id',), ID),
+        ('number', ('number',), INT),
+        ('position', ('position',), INT),
+        ('rank', ('rank',), INT),
+    ) + _PARTICIPANT_COLUMNS + (
+        ('points', ('points',), INT),
+        ('properties', ('properties',), JSON),
+    ),
+    'standings': (
+        ('id', ('id',), ID),
+        ('tournament_id', ('tournament_id',), ID),
+        ('position', ('position',), INT),
+        ('rank', ('rank',), INT),
+    ) + _PARTICIPANT_COLUMNS,
+    'videos': (
+        ('id', ('id',), ID),
+        ('match_id', ('match_id',), ID),
+        ('name', ('name',), STR),
+        ('url', ('url',), STR),
+        ('language', ('language',), STR),
+        ('category', ('category',), STR),
+    ),
+}
+"""The columns of every kind of record: the name, the path of keys in the decoded JSON and the type."""
+
+FORMATS = {
+    '.parquet': 'parquet',
+    '.csv': 'csv',
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+}
+
+
+def default_format():
+    """:returns 'parquet' if pyarrow is installed, 'csv' otherwise."""
+
+    return 'parquet' if pyarrow is not None else 'csv'
+
+
+def _get(record, path):
+    for key in path:
+        if record is None:
+            return None
+
+        record = record.get(key)
+
+    return record
+
+
+class RecordWriter(metaclass=ABCMeta):
+
+    def __init__(self, path, kind):
+        """Writes records (decoded JSON) of one kind to a file, a batch at a time.
+        :param path The path of the file.
+        :param kind The kind of the records, a key of COLUMNS."""
+
+        if kind not in COLUMNS:
+            raise ValueError('Unknown kind of records: {}. Available: {}'.format(kind, ', '.join(COLUMNS)))
+
+        self.path = path
+        self.kind = kind
+        self.columns = COLUMNS[kind]
+        self.rows = 0
+
+    def write(self, records):
+        """Writes a batch of records and flushes them to the file.
+        :param records A list of records as decoded JSON."""
+
+        self._write(records)
+        self.rows += len(records)
+
+    @abstractmethod
+    def _write(self, records):
+        """Writes a batch of records to the file."""
+
+    @abstractmethod
+    def close(self):
+        """Flushes and closes the file."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class CSVWriter(RecordWriter):
+
+    def __init__(self, path, kind):
+        """Writes the records as CSV with a header. JSON columns hold the JSON text, missing values are empty."""
+
+        super().__init__(path, kind)
+
+        self._file = open(path, 'w', newline = '', encoding = 'utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([name for name, _, _ in self.columns])
+
+    def _write(self, records):
+        columns = self.columns
+
+        self._writer.writerows([[_csv_value(_get(record, path), type) for _, path, type in columns]
+                                for record in records])
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def _csv_value(value, type):
+    if value is None:
+        return ''
+
+    if type == JSON:
+        return json.dumps(value, separators = (',', ':'))
+
+    return value
+
+
+class NDJSONWriter(RecordWriter):
+
+    def __init__(self, path, kind):
+        """Writes every record unchanged, as one JSON object per line."""
+
+        super().__init__(path, kind)
+
+        self._file = open(path, 'w', encoding = 'utf-8')
+
+    def _write(self, records):
+        self._file.writelines(json.dumps(record, separators = (',', ':')) + '\n' for record in records)
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetWriter(RecordWriter):
+
+    def __init__(self, path, kind):
+        """Writes the records as Parquet, a row group per batch. Ids are 64 bit integers, timestamps are UTC timestamps
+        and JSON columns hold the JSON text.
+        :raises ImportError If pyarrow is not installed."""
+
+        if pyarrow is None:
+            raise ImportError('pyarrow is required to write Parquet files.')
+
+        super().__init__(path, kind)
+
+        types = {
+            ID: pyarrow.int64(),
+            INT: pyarrow.int64(),
+            STR: pyarrow.string(),
+            DATETIME: pyarrow.timestamp('us', tz = 'UTC'),
+            JSON: pyarrow.string(),
+        }
+
+        self.schema = pyarrow.schema([(name, types[type]) for name, _, type in self.columns])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+
+    def _write(self, records):
+        arrays = [[_parquet_value(_get(record, path), type) for record in records] for _, path, type in self.columns]
+
+        self._writer.write_table(pyarrow.Table.from_arrays(arrays, schema = self.schema))
+
+    def close(self):
+        self._writer.close()
+
+
+def _parquet_value(value, type):
+    if value is None:
+        return None
+
+    if type == ID:
+        return int(value)
+
+    if type == DATETIME:
+        return Converter.datetime(value)
+
+    if type == JSON:
+        return json.dumps(value, separators = (',', ':'))
+
+    return value
+
+
+WRITERS = {
+    'parquet': ParquetWriter,
+    'csv': CSVWriter,
+    'ndjson': NDJSONWriter,
+}
+
+
+def open_writer(path, kind, format=None) -> RecordWriter:
+    """:param path The path of the file.
+    :param kind The kind of the records, a key of COLUMNS.
+    :param format 'parquet', 'csv' or 'ndjson'. Defaults to the format of the extension of `path`.
+    :returns A RecordWriter for the file."""
+
+    if format is None:
+        extension = str(path)[str(path).rfind('.'):].lower()
+
+        if extension not in FORMATS:
+            raise ValueError('Cannot infer the format of {}. Pass format as one of: {}'.format(path, ', '.join(WRITERS)))
+
+        format = FORMATS[extension]
+
+    if format not in WRITERS:
+        raise ValueError('Unknown format: {}. Available: {}'.format(format, ', '.join(WRITERS)))
+
+    return WRITERS[format](path, kind)
+
+
+def export(records, path, kind, *, format=None, batch_size=1000) -> int:
+    """Writes records to a file while they are fetched, so that only one batch is held in memory:
+
+        export(connector.iter_matches_from_tournament(10000000000000, raw=True), 'matches.parquet', 'matches')
+
+    :param records An iterable of records as decoded JSON, like an iter_* method with `raw=True`.
+    :param path The path of the file.
+    :param kind The kind of the records: 'matches', 'participants', 'ranking_items', 'standings' or 'videos'.
+    :param format 'parquet', 'csv' or 'ndjson'. Defaults to the format of the extension of `path`.
+    :param batch_size The number of records written at once, and the size of Parquet row groups.
+    :returns The number of records written."""
+
+    iterator = iter(records)
+
+    with open_writer(path, kind, format) as writer:
+        batch = list(islice(iterator, batch_size))
+
+        while batch:
+            writer.write(batch)
+            batch = list(islice(iterator, batch_size))
+
+    return writer.rows
+
+
+async def export_async(records, path, kind, *, format=None, batch_size=1000) -> int:
+    """Like `export`, for an asynchron iterable of records.
+    :returns The number of records written."""
+
+    with open_writer(path, kind, format) as writer:
+        batch = []
+
+        async for record in records:
+            batch.append(record)
+
+            if len(batch) >= batch_size:
+                writer.write(batch)
+                batch = []
+
+        if batch:
+            writer.write(batch)
+
+    return writer.rows
@@ -0,0 +1,154 @@
+import threading
+import weakref
+
+_state = threading.local()
+
+
+def current_hydration():
+    """:returns The innermost active Hydration of this thread or None."""
+
+    stack = getattr(_state, 'stack', None)
+
+    return stack[-1] if stack else None
+
+
+class Hydration:
+
+    def __init__(self, *, lazy=False, identity_map=None):
+        """Options for building schema objects. They apply to all objects built while the Hydration is active:
+
+            with Hydration(lazy=True):
+                match = Match(**data)
+
+        :param lazy If True, nested objects (opponents, games, participants...) are built and timestamps are parsed on
+        first access instead of together with their parent. The raw data is kept until then.
+        :param identity_map An IdentityMap resolving the participants of opponents, ranking and standing items."""
+
+        self.lazy = lazy
+        self.identity_map = identity_map
+
+    def __enter__(self):
+        stack = getattr(_state, 'stack', None)
+
+        if stack is None:
+            stack = _state.stack = []
+
+        stack.append(self)
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _state.stack.pop()
+
+
+class Lazy:
+
+    __slots__ = ('function', 'arguments', 'hydration')
+
+    def __init__(self, function, arguments, hydration):
+        """A value of an attribute that was not built yet, with the raw data to build it from."""
+
+        self.function = function
+        self.arguments = arguments
+        self.hydration = hydration
+
+    def build(self):
+        with self.hydration:
+            return self.function(*self.arguments)
+
+
+class IdentityMap:
+
+    def __init__(self):
+        """Resolves objects with the same id to one instance, as long as it is referenced somewhere else. The instance is
+        updated in place with the data of every response it appears in."""
+
+        self._objects = weakref.WeakValueDictionary()
+
+    def resolve(self, schema, data):
+        """:param schema The class of the object. It has to support weak references.
+        :param data The decoded JSON of the object, with an `id`.
+        :returns The instance for the id, built or updated with `data`."""
+
+        key = (schema, str(data['id']))
+        instance = self._objects.get(key)
+
+        if instance is None:
+            instance = self._objects[key] = schema(**data)
+        else:
+            instance.__init__(**data)
+
+        return instance
+
+    def __len__(self):
+        return len(self._objects)
+
+
+def _build(schema, data, many, shared=False):
+    if many:
+        return [schema(**item) for item in data]
+
+    if not data:
+        return None
+
+    if shared:
+        identity_map = getattr(current_hydration(), 'identity_map', None)
+
+        if identity_map is not None:
+            return identity_map.resolve(schema, data)
+
+    return schema(**data)
+
+
+def nested(schema, data, many=False, shared=False):
+    """Builds a nested attribute of a schema object, or defers it if the current Hydration is lazy.
+    :param schema A callable building one object from the keywords of its data.
+    :param data The decoded JSON of the object, or the list of objects if `many`.
+    :param many Whether `data` is a list of objects.
+    :param shared Whether a single object is resolved with the IdentityMap of the current Hydration.
+    :returns The built object(s) or a Lazy placeholder. Falsy data of a single object is built to None."""
+
+    hydration = current_hydration()
+
+    if data and hydration is not None and hydration.lazy:
+        return Lazy(_build, (schema, data, many, shared), hydration)
+
+    return _build(schema, data, many, shared)
+
+
+def converted(converter, value):
+    """Converts a value of a schema object, or defers it if the current Hydration is lazy.
+    :param converter A callable converting the value, like `Converter.datetime`.
+    :param value The value from the decoded JSON.
+    :returns The converted value or a Lazy placeholder."""
+
+    hydration = current_hydration()
+
+    if value and hydration is not None and hydration.lazy:
+        return Lazy(converter, (value,), hydration)
+
+    return converter(value)
+
+
+class LazyAttribute:
+    """A descriptor for an attribute that may hold a Lazy value. The value is stored in the slot with the same name
+    prefixed by an underscore. A Lazy value is built and memoized on first access."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.slot = getattr(owner, '_' + name)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        value = self.slot.__get__(instance, owner)
+
+        if type(value) is Lazy:
+            value = value.build()
+            self.slot.__set__(instance, value)
+
+        return value
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
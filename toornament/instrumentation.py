@@ -0,0 +1,103 @@
+import time
+import aiohttp
+
+RESPONSE_FIELDS = ('url', 'status', 'dns', 'connect', 'ttfb', 'bytes', 'decode', 'cache', 'retries')
+"""The fields of a RequestEvent that describe the request sent and its response, rather than the call."""
+
+
+class RequestEvent:
+
+    __slots__ = ('method', 'endpoint', 'url', 'status', 'dns', 'connect', 'ttfb', 'total', 'bytes', 'decode', 'hydrate',
+                 'cache', 'retries', 'error', 'started')
+
+    def __init__(self, method, endpoint):
+        """Describes one call of an endpoint method. Connectors pass it to their `on_request` hooks when the call is
+        done. Times are in seconds, and None if they do not apply or are not known.
+        :ivar method The HTTP method.
+        :ivar endpoint The path template of the endpoint, like '/tournaments/{tournament_id}/matches'.
+        :ivar url The URL of the request, without query string. None if it was answered from the cache.
+        :ivar status The HTTP status of the last response.
+        :ivar dns The time to resolve the host. Only measured by asynchron connectors, for new connections.
+        :ivar connect The time to open the connection, including dns. Only measured by asynchron connectors, for new
+        connections.
+        :ivar ttfb The time from sending the last attempt until the headers of the response arrived.
+        :ivar total The time of the whole call, including waiting for the rate limiter, retries and hydration.
+        :ivar bytes The size of the body of the response.
+        :ivar decode The time to decode the JSON.
+        :ivar hydrate The time to build the schema objects. None with `raw=True`.
+        :ivar cache 'hit', 'miss' or 'revalidated' if the connector has a cache, 'coalesced' if the response of an
+        identical request in flight was shared.
+        :ivar retries The number of retried attempts.
+        :ivar error The exception the call raised, if any.
+        :ivar started The `time.perf_counter()` the call started at."""
+
+        self.method = method
+        self.endpoint = endpoint
+        self.url = None
+        self.status = None
+        self.dns = None
+        self.connect = None
+        self.ttfb = None
+        self.total = None
+        self.bytes = None
+        self.decode = None
+        self.hydrate = None
+        self.cache = None
+        self.retries = 0
+        self.error = None
+        self.started = time.perf_counter()
+
+    def copy_response(self, other):
+        """Copies the RESPONSE_FIELDS of another event, like the one of a request shared by coalesced calls."""
+
+        for name in RESPONSE_FIELDS:
+            setattr(self, name, getattr(other, name))
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return '<RequestEvent {} {} status={} total={}>'.format(self.method, self.endpoint, self.status, self.total)
+
+
+async def _on_dns_resolvehost_start(session, context, params):
+    context.dns_start = time.perf_counter()
+
+
+async def _on_dns_resolvehost_end(session, context, params):
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx.dns = time.perf_counter() - context.dns_start
+
+
+async def _on_connection_create_start(session, context, params):
+    context.connect_start = time.perf_counter()
+
+
+async def _on_connection_create_end(session, context, params):
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx.connect = time.perf_counter() - context.connect_start
+
+
+async def _on_request_start(session, context, params):
+    context.request_start = time.perf_counter()
+
+
+async def _on_request_end(session, context, params):
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx.ttfb = time.perf_counter() - context.request_start
+
+
+def trace_config() -> aiohttp.TraceConfig:
+    """:returns A TraceConfig measuring the dns, connect and ttfb times of requests sent with a RequestEvent as
+    `trace_request_ctx`."""
+
+    config = aiohttp.TraceConfig()
+
+    config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+    config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+    config.on_connection_create_start.append(_on_connection_create_start)
+    config.on_connection_create_end.append(_on_connection_create_end)
+    config.on_request_start.append(_on_request_start)
+    config.on_request_end.append(_on_request_end)
+
+    return config
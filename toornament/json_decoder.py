@@ -0,0 +1,47 @@
+import json
+
+
+def _orjson():
+    import orjson
+    return orjson.loads
+
+
+def _ujson():
+    import ujson
+    return ujson.loads
+
+
+def _json():
+    return json.loads
+
+
+BACKENDS = {
+    'orjson': _orjson,
+    'ujson': _ujson,
+    'json': _json,
+}
+
+
+def get_decoder(backend='auto'):
+    """:param backend The name of a JSON library ('orjson', 'ujson' or 'json'), 'auto' for the fastest one that is
+    installed, or a callable decoding bytes.
+    :returns A callable decoding the bytes of a response body.
+    :raises ImportError If the requested library is not installed.
+    :raises ValueError If the backend is unknown."""
+
+    if callable(backend):
+        return backend
+
+    if backend == 'auto':
+        for name in ('orjson', 'ujson'):
+            try:
+                return BACKENDS[name]()
+            except ImportError:
+                pass
+
+        return json.loads
+
+    if backend not in BACKENDS:
+        raise ValueError('Unknown JSON backend: {}. Available: {}'.format(backend, ', '.join(BACKENDS)))
+
+    return BACKENDS[backend]()
@@ -0,0 +1,269 @@
+import threading
+
+PRECISION = 7
+"""The number of significant bits of the histogram buckets. Values are recorded with a relative error below 1%."""
+
+UNIT = 1e-6
+"""The resolution of the histograms in seconds."""
+
+QUANTILES = {'p50': 0.5, 'p90': 0.9, 'p99': 0.99, 'p999': 0.999}
+"""The quantiles reported by snapshots and the Prometheus text, by their key in snapshots."""
+
+
+def _bucket(value):
+    """:param value A non-negative integer.
+    :returns The index of the bucket of `value`. Values below 2 ** PRECISION have a bucket each, above that the
+    buckets double in width with every power of two."""
+
+    shift = value.bit_length() - PRECISION
+
+    if shift <= 0:
+        return value
+
+    return (shift << (PRECISION - 1)) + (value >> shift)
+
+
+def _bounds(index):
+    """:returns The lowest and highest value of the bucket `index`."""
+
+    if index < 1 << PRECISION:
+        return index, index
+
+    shift = (index >> (PRECISION - 1)) - 1
+    mantissa = index - (shift << (PRECISION - 1))
+
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class Histogram:
+
+    __slots__ = ('counts', 'count', 'sum', 'min', 'max')
+
+    def __init__(self):
+        """A histogram of durations with logarithmic buckets, like a HDR histogram: the buckets are exact below
+        2 ** PRECISION microseconds and keep PRECISION significant bits above. Memory only grows with the range of
+        the recorded values, not their number."""
+
+        self.counts = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def record(self, seconds):
+        """:param seconds The duration to record."""
+
+        index = _bucket(max(0, int(seconds / UNIT)))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.sum += seconds
+
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q) -> float:
+        """:param q The quantile, between 0 and 1.
+        :returns The duration in seconds that a share `q` of the recorded values do not exceed, or None if the
+        histogram is empty."""
+
+        if not self.count:
+            return None
+
+        rank = max(1, round(q * self.count))
+        seen = 0
+
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+
+            if seen >= rank:
+                lower, upper = _bounds(index)
+                return min(max((lower + upper + 1) / 2 * UNIT, self.min), self.max)
+
+        return self.max
+
+    @property
+    def mean(self):
+        return self.sum / self.count if self.count else None
+
+    def merge(self, other):
+        """Adds the values of another Histogram to this one."""
+
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+
+        self.count += other.count
+        self.sum += other.sum
+
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def snapshot(self) -> dict:
+        """:returns The count, sum, min, max, mean and QUANTILES of the durations in seconds."""
+
+        snapshot = {'count': self.count, 'sum': self.sum, 'min': self.min, 'max': self.max, 'mean': self.mean}
+
+        for key, q in QUANTILES.items():
+            snapshot[key] = self.quantile(q)
+
+        return snapshot
+
+
+class EndpointMetrics:
+
+    __slots__ = ('method', 'endpoint', 'requests', 'in_flight', 'errors', 'bytes', 'latency')
+
+    def __init__(self, method, endpoint):
+        """The metrics of one endpoint template.
+        :ivar requests The number of finished calls.
+        :ivar in_flight The number of calls not finished yet.
+        :ivar errors The number of calls that raised, by HTTP status. Calls without response count as status None.
+        :ivar bytes The total size of the response bodies.
+        :ivar latency A Histogram of the total times of the calls."""
+
+        self.method = method
+        self.endpoint = endpoint
+        self.requests = 0
+        self.in_flight = 0
+        self.errors = {}
+        self.bytes = 0
+        self.latency = Histogram()
+
+    def snapshot(self) -> dict:
+        return {
+            'method': self.method,
+            'requests': self.requests,
+            'in_flight': self.in_flight,
+            'errors': dict(self.errors),
+            'bytes': self.bytes,
+            'latency': self.latency.snapshot(),
+        }
+
+
+class MetricsRegistry:
+
+    def __init__(self):
+        """Counters and latency histograms per endpoint template, like '/tournaments/{tournament_id}/matches'.
+        A registry is fed with the RequestEvents of connectors, and can be shared by several of them:
+
+            metrics = MetricsRegistry()
+            connector = SyncViewerAPI('Your Token', metrics=metrics)
+            ...
+            print(metrics.snapshot()['/tournaments/{tournament_id}/matches']['latency']['p99'])
+
+        Passed as `metrics`, the connector also reports the calls in flight. The registry can be added as a plain
+        `on_request` hook too, without the calls in flight."""
+
+        self.endpoints = {}
+        self._lock = threading.Lock()
+
+    def _get(self, event):
+        metrics = self.endpoints.get(event.endpoint)
+
+        if metrics is None:
+            metrics = self.endpoints[event.endpoint] = EndpointMetrics(event.method, event.endpoint)
+
+        return metrics
+
+    def started(self, event):
+        """Counts a call as in flight until it is recorded.
+        :param event The RequestEvent of the call."""
+
+        with self._lock:
+            self._get(event).in_flight += 1
+
+    def record(self, event, *, finished=False):
+        """Records a finished call.
+        :param event The RequestEvent of the call.
+        :param finished Whether the call was counted by `started`."""
+
+        with self._lock:
+            metrics = self._get(event)
+
+            metrics.requests += 1
+            metrics.bytes += event.bytes or 0
+            metrics.latency.record(event.total)
+
+            if finished:
+                metrics.in_flight -= 1
+
+            if event.error is not None:
+                metrics.errors[event.status] = metrics.errors.get(event.status, 0) + 1
+
+    def __call__(self, event):
+        self.record(event)
+
+    def reset(self):
+        """Removes all metrics. Calls in flight are kept."""
+
+        with self._lock:
+            in_flight = {endpoint: metrics for endpoint, metrics in self.endpoints.items() if metrics.in_flight}
+            self.endpoints = {endpoint: EndpointMetrics(metrics.method, endpoint)
+                              for endpoint, metrics in in_flight.items()}
+
+            for endpoint, metrics in in_flight.items():
+                self.endpoints[endpoint].in_flight = metrics.in_flight
+
+    def snapshot(self) -> dict:
+        """:returns A dict of the endpoint templates and their metrics: the method, the numbers of requests, calls in
+        flight, errors by status and bytes, and the count, sum, min, max, mean and quantiles of the latency."""
+
+        with self._lock:
+            return {endpoint: metrics.snapshot() for endpoint, metrics in sorted(self.endpoints.items())}
+
+    def prometheus(self, prefix='toornament') -> str:
+        """:param prefix The prefix of the names of the metrics.
+        :returns The metrics in the Prometheus text format, with the labels `method` and `endpoint`. The latency is a
+        summary of the quantiles QUANTILES."""
+
+        snapshot = self.snapshot()
+        lines = []
+
+        def metric(name, type, help, samples):
+            lines.append('# HELP {}_{} {}'.format(prefix, name, help))
+            lines.append('# TYPE {}_{} {}'.format(prefix, name, type))
+
+            for suffix, labels, value in samples:
+                lines.append('{}_{}{}{{{}}} {}'.format(prefix, name, suffix, ','.join(
+                    '{}="{}"'.format(label, _escape(value)) for label, value in labels), _number(value)))
+
+        def labels(endpoint, metrics, *more):
+            return (('method', metrics['method']), ('endpoint', endpoint)) + more
+
+        metric('requests_total', 'counter', 'Finished calls of endpoint methods.', [
+            ('', labels(endpoint, metrics), metrics['requests']) for endpoint, metrics in snapshot.items()])
+
+        metric('request_errors_total', 'counter', 'Calls of endpoint methods that raised, by HTTP status.', [
+            ('', labels(endpoint, metrics, ('status', '' if status is None else status)), count)
+            for endpoint, metrics in snapshot.items()
+            for status, count in sorted(metrics['errors'].items(), key = lambda item: str(item[0]))])
+
+        metric('requests_in_flight', 'gauge', 'Calls of endpoint methods not finished yet.', [
+            ('', labels(endpoint, metrics), metrics['in_flight']) for endpoint, metrics in snapshot.items()])
+
+        metric('response_bytes_total', 'counter', 'Size of the response bodies.', [
+            ('', labels(endpoint, metrics), metrics['bytes']) for endpoint, metrics in snapshot.items()])
+
+        samples = []
+        for endpoint, metrics in snapshot.items():
+            for key, q in QUANTILES.items():
+                value = metrics['latency'][key]
+                samples.append(('', labels(endpoint, metrics, ('quantile', q)), 'NaN' if value is None else value))
+
+            samples.append(('_sum', labels(endpoint, metrics), metrics['latency']['sum']))
+            samples.append(('_count', labels(endpoint, metrics), metrics['latency']['count']))
+
+        metric('request_duration_seconds', 'summary', 'Total time of calls of endpoint methods.', samples)
+
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
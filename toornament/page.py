@@ -0,0 +1,77 @@
+from .range import Range, parse_content_range
+
+
+class Page(list):
+
+    def __init__(self, items=(), content_range=None, requested=None):
+        """A list of items returned by an endpoint that takes a Range.
+        :param items The items of the page.
+        :param content_range The value of the Content-Range header of the response.
+        :param requested The Range that was requested.
+
+        Besides the items, a Page has these attributes. They are None if the API did not send a Content-Range.
+        :ivar unit The unit of the Range.
+        :ivar start The index of the first item of the page.
+        :ivar end The index of the last item of the page.
+        :ivar total The number of items in the whole collection."""
+
+        super().__init__(items)
+
+        self.requested = requested
+        self.unit, self.start, self.end, self.total = parse_content_range(content_range) or (None, None, None, None)
+
+    def with_items(self, items):
+        """:returns A new Page with the same Range information, holding `items`."""
+
+        page = Page(items, requested = self.requested)
+        page.unit, page.start, page.end, page.total = self.unit, self.start, self.end, self.total
+
+        return page
+
+    @property
+    def is_truncated(self) -> bool:
+        """Whether the page holds less items than requested, although more items exist."""
+
+        if self.requested is None or self.total is None:
+            return False
+
+        requested_end = min(self.requested.end, self.total - 1)
+        end = self.end if self.end is not None else self.requested.start + len(self) - 1
+
+        return end < requested_end
+
+    @property
+    def has_more(self) -> bool:
+        """Whether there are items after this page. If the API did not send a total, a page that is as large as
+        requested is assumed to have a successor."""
+
+        if not self:
+            return False
+
+        if self.total is not None:
+            return self._next_start() < self.total
+
+        if self.requested is not None:
+            return len(self) >= self.requested.end - self.requested.start + 1
+
+        return False
+
+    def next_range(self, size=None):
+        """:param size The size of the next Range. Defaults to the size of the requested Range.
+        :returns The Range following this page or None, if this was the last page."""
+
+        if not self.has_more:
+            return None
+
+        if size is None:
+            size = self.requested.end - self.requested.start + 1 if self.requested is not None else len(self)
+
+        start = self._next_start()
+
+        return Range(start, start + size - 1, unit = self.unit or (self.requested.unit if self.requested else None))
+
+    def _next_start(self):
+        if self.end is not None:
+            return self.end + 1
+
+        return (self.requested.start if self.requested is not None else 0) + len(self)
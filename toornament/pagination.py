@@ -0,0 +1,89 @@
+import asyncio
+from collections import deque
+from .range import Range
+
+
+def iterate(getter, unit_span, args, kwargs):
+    """Calls `getter` with consecutive Ranges and yields the items of every page.
+    :param getter A synchron get_* method taking a `range` keyword argument.
+    :param unit_span The maximal size of a Range for the endpoint.
+    :param args Positional arguments for the getter.
+    :param kwargs Keyword arguments for the getter."""
+
+    range = Range(0, unit_span - 1)
+
+    while range is not None:
+        page = getter(*args, range = range, **kwargs)
+
+        yield from page
+
+        range = page.next_range()
+
+
+async def async_iterate(getter, unit_span, args, kwargs, concurrency=1):
+    """Same as `iterate`, but for asynchron get_* methods.
+    Once the first page reported the total, up to `concurrency` of the remaining pages are fetched at the same time.
+    The items are still yielded in order.
+    :param concurrency The maximal number of pages requested at the same time."""
+
+    if concurrency < 1:
+        raise ValueError('Concurrency has to be at least 1. Received: {}'.format(concurrency))
+
+    range = Range(0, unit_span - 1)
+
+    while range is not None:
+        page = await getter(*args, range = range, **kwargs)
+
+        for item in page:
+            yield item
+
+        range = page.next_range()
+
+        if range is not None and page.total is not None and concurrency > 1:
+            async for item in _prefetch(getter, unit_span, args, kwargs, range.start, page.total, concurrency):
+                yield item
+            return
+
+
+async def _prefetch(getter, unit_span, args, kwargs, start, total, concurrency):
+    """Fetches the windows from `start` to `total` with at most `concurrency` requests in flight."""
+
+    windows = iter(range(start, total, unit_span))
+    pending = deque()
+
+    def schedule():
+        for window_start in windows:
+            request = getter(*args, range = Range(window_start, window_start + unit_span - 1), **kwargs)
+            pending.append(asyncio.ensure_future(request))
+            return
+
+    try:
+        for _ in range(concurrency):
+            schedule()
+
+        while pending:
+            page = await pending.popleft()
+            schedule()
+
+            for item in page:
+                yield item
+
+            async for item in _fill(getter, args, kwargs, page):
+                yield item
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _fill(getter, args, kwargs, page):
+    """Fetches the items a truncated page is missing, up to the end of the window it requested, so that the items of
+    the next window follow without a gap."""
+
+    requested = page.requested
+
+    while page and page.is_truncated:
+        start = page.end + 1 if page.end is not None else page.requested.start + len(page)
+        page = await getter(*args, range = Range(start, requested.end, unit = requested.unit), **kwargs)
+
+        for item in page:
+            yield item
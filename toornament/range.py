@@ -47,3 +47,28 @@ class Range:
     def get_header_value(self):
         check_for_range(self.start, self.end)
         return '{0.unit}={0.start}-{0.end}'.format(self)
+
+
+def parse_content_range(value):
+    """Parses the value of a Content-Range header like `matches 0-49/1236`.
+    :param value The header value. May be None.
+    :returns Tuple (unit, start, end, total). Values that are not given are None. Returns None if there was no header or it can not be parsed."""
+
+    if not value:
+        return None
+
+    try:
+        unit, _, rest = value.strip().partition(' ')
+        span, _, total = rest.partition('/')
+
+        if span == '*':
+            start = end = None
+        else:
+            start, _, end = span.partition('-')
+            start, end = int(start), int(end)
+
+        total = None if total in ('', '*') else int(total)
+    except ValueError:
+        return None
+
+    return unit.lower(), start, end, total
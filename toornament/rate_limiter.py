@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+
+def parse_retry_after(value):
+    """Parses the value of a Retry-After header.
+    :param value The header value, either a number of seconds or a HTTP-date. May be None.
+    :returns The number of seconds to wait or None if it could not be parsed."""
+
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """A token bucket that limits the number of requests per second.
+    One limiter can be shared by several connections, synchron and asynchron ones alike."""
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, rate, burst=None):
+        """
+        :param rate The number of requests per second that are allowed on average.
+        :param burst The number of requests that can be sent at once after an idle period. Defaults to `rate`.
+        """
+
+        if rate <= 0:
+            raise ValueError('Rate has to be positive. Received: {}'.format(rate))
+
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_token(cls, token, rate, burst=None):
+        """:returns The limiter shared by all connections using the API-Key `token`. It is created with `rate` and
+        `burst` on first use, later calls return the existing limiter."""
+
+        with cls._shared_lock:
+            limiter = cls._shared.get(token)
+
+            if limiter is None:
+                limiter = cls._shared[token] = cls(rate, burst)
+
+            return limiter
+
+    def _reserve(self) -> float:
+        """Takes a token from the bucket.
+        :returns The number of seconds the caller has to wait before sending the request."""
+
+        with self._lock:
+            now = time.monotonic()
+
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            return max(delay, self._paused_until - now)
+
+    def acquire(self):
+        """Blocks until a request may be sent."""
+
+        delay = self._reserve()
+
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        """Waits without blocking the event loop until a request may be sent."""
+
+        delay = self._reserve()
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds):
+        """Lets all callers wait at least `seconds` before their next request, e.g. as requested by Retry-After."""
+
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def honour_retry_after(self, value):
+        """Pauses for the time given in a Retry-After header, or for the time of one token if it is missing.
+        :param value The value of the Retry-After header. May be None."""
+
+        delay = parse_retry_after(value)
+
+        self.pause(delay if delay is not None else 1 / self.rate)
@@ -0,0 +1,72 @@
+import random
+from .rate_limiter import parse_retry_after
+
+
+class RetryPolicy:
+    """Decides whether a failed request is sent again and how long to wait before.
+    The waiting time grows exponentially with every attempt and is randomized by a jitter."""
+
+    def __init__(self, max_attempts=3, backoff_base=0.5, backoff_max=30.0, jitter=1.0,
+                 retry_statuses=(429, 500, 502, 503, 504), idempotent_methods=('GET', 'HEAD', 'OPTIONS'),
+                 on_retry=None):
+        """
+        :param max_attempts The maximal number of attempts, including the first one.
+        :param backoff_base The waiting time in seconds before the second attempt. It doubles with every attempt.
+        :param backoff_max The maximal waiting time in seconds.
+        :param jitter The share of the waiting time that is randomized, between 0 (no jitter) and 1 (full jitter).
+        :param retry_statuses HTTP status codes of responses that are retried.
+        :param idempotent_methods HTTP methods that are safe to be retried. Requests using other methods are never retried.
+        :param on_retry A list of callables. Each is called before waiting, with the keywords attempt, delay, method, url, status and error.
+        """
+
+        if max_attempts < 1:
+            raise ValueError('Max attempts has to be at least 1. Received: {}'.format(max_attempts))
+        if not 0 <= jitter <= 1:
+            raise ValueError('Jitter has to be between 0 and 1. Received: {}'.format(jitter))
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(method.upper() for method in idempotent_methods)
+        self.on_retry = list(on_retry) if on_retry else []
+
+    def add_hook(self, hook):
+        """Adds a callable to `on_retry`."""
+
+        self.on_retry.append(hook)
+
+    def is_idempotent(self, method) -> bool:
+        return method.upper() in self.idempotent_methods
+
+    def backoff(self, attempt) -> float:
+        """:returns The waiting time after the failed attempt number `attempt` (starting with 1)."""
+
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+
+        return delay * (1 - self.jitter) + random.uniform(0, delay * self.jitter)
+
+    def retry_delay(self, method, url, attempt, *, status=None, error=None, retry_after=None):
+        """Decides about retrying the failed attempt number `attempt` and calls the hooks if so.
+        :param status The status code of the response, if there was one.
+        :param error The exception raised by the transport, if there was one.
+        :param retry_after The value of the Retry-After header of the response.
+        :returns The number of seconds to wait before the next attempt, or None if the request must not be retried."""
+
+        if attempt >= self.max_attempts or not self.is_idempotent(method):
+            return None
+
+        if error is None and status not in self.retry_statuses:
+            return None
+
+        delay = self.backoff(attempt)
+
+        requested = parse_retry_after(retry_after)
+        if requested is not None:
+            delay = max(delay, min(requested, self.backoff_max))
+
+        for hook in self.on_retry:
+            hook(attempt = attempt, delay = delay, method = method, url = url, status = status, error = error)
+
+        return delay
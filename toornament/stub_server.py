@@ -0,0 +1,728 @@
+"""A local stand-in for the Viewer API, serving synthetic or recorded data. It is meant for offline tests and benchmarks:
+
+    server = StubServer(StubData(participants=256), latency=0.01)
+
+    with server.running() as base_url:
+        connector = SyncViewerAPI('any key', base_url=base_url)
+        matches = connector.get_matches_from_tournament(server.data.tournament_ids[0], range=Range(0, 127))
+
+It can also be started from the command line with `python -m toornament.stub_server --port 8080`."""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from aiohttp import web
+from .viewer_api import VIEWER_ENDPOINTS
+
+PREFIX = '/viewer/v2'
+
+FIRST_ID = 3000000000000000000
+
+_DETAILED_TOURNAMENT = ('participant_type', 'organization', 'contact', 'discord', 'website', 'description', 'rules',
+                        'prize', 'settings')
+_DETAILED_MATCH = ('public_notes', 'games')
+_DETAILED_DISCIPLINE = ('platforms_available', 'team_size', 'features')
+
+
+class StubData:
+
+    def __init__(self, *, seed=0, tournaments=2, participants=16, played=0.5, discipline='splatoon2'):
+        """Synthetic data of the Viewer API: tournaments with one single elimination stage each.
+        Records are kept as decoded JSON. Keys starting with an underscore are only used for filtering and are not
+        served.
+        :param seed The seed of the random scores and results.
+        :param tournaments The number of tournaments.
+        :param participants The number of participants of every tournament. A tournament has about as many matches.
+        :param played The share of rounds that are completed.
+        :param discipline The id of the discipline of the tournaments."""
+
+        self._random = random.Random(seed)
+        self._next_id = FIRST_ID
+
+        self.disciplines = [{
+            'id': discipline,
+            'name': discipline.capitalize(),
+            'shortname': discipline[:8],
+            'fullname': discipline.capitalize(),
+            'copyrights': 'Synthetic data',
+            'platforms_available': ['pc'],
+            'team_size': {'min': 1, 'max': 1},
+            'features': [],
+        }]
+
+        self.tournaments = []
+        self.playlists = []
+        self.participants = {}
+        self.custom_fields = {}
+        self.stages = {}
+        self.groups = {}
+        self.rounds = {}
+        self.matches = {}
+        self.bracket_nodes = {}
+        self.ranking_items = {}
+        self.standings = []
+        self.streams = {}
+        self.videos = {}
+
+        for number in range(1, tournaments + 1):
+            self._add_tournament(number, discipline, participants, played)
+
+        self.playlists.append({
+            'id': self._id(),
+            'name': 'All tournaments',
+            'description': None,
+            '_tournament_ids': self.tournament_ids,
+        })
+
+    @property
+    def tournament_ids(self):
+        return [tournament['id'] for tournament in self.tournaments]
+
+    def _id(self):
+        self._next_id += 1
+
+        return str(self._next_id)
+
+    def _add_tournament(self, number, discipline, size, played):
+        tournament_id = self._id()
+        start = datetime(2020, 6, 1, 18, tzinfo = timezone.utc) + timedelta(days = 7 * number)
+
+        participants = [{'id': self._id(), 'name': 'Participant {}'.format(seed), 'custom_fields': {}}
+                        for seed in range(1, size + 1)]
+
+        rounds_count = max(1, (size - 1).bit_length())
+        played_rounds = round(rounds_count * played)
+        status = 'completed' if played_rounds == rounds_count else 'running' if played_rounds else 'pending'
+
+        self.tournaments.append({
+            'id': tournament_id,
+            'discipline': discipline,
+            'name': 'Tournament {}'.format(number),
+            'full_name': 'Synthetic Tournament {}'.format(number),
+            'status': status,
+            'scheduled_date_start': start.date().isoformat(),
+            'scheduled_date_end': (start + timedelta(days = 1)).date().isoformat(),
+            'timezone': 'UTC',
+            'public': True,
+            'size': size,
+            'online': True,
+            'location': None,
+            'country': 'FR',
+            'platforms': ['pc'],
+            'logo': None,
+            'registration_enabled': False,
+            'registration_opening_datetime': None,
+            'registration_closing_datetime': None,
+            'participant_type': 'player',
+            'organization': None,
+            'contact': None,
+            'discord': None,
+            'website': None,
+            'description': None,
+            'rules': None,
+            'prize': None,
+            'settings': {},
+        })
+
+        stage = {'id': self._id(), 'number': 1, 'name': 'Playoffs', 'type': 'single_elimination', 'closed': False,
+                 'settings': {}}
+        group = {'id': self._id(), 'stage_id': stage['id'], 'number': 1, 'name': 'Bracket', 'closed': False,
+                 'settings': {}, '_stage_number': 1}
+
+        self.participants[tournament_id] = participants
+        self.custom_fields[tournament_id] = [{
+            'machine_name': 'country', 'label': 'Country', 'target_type': 'player', 'type': 'country',
+            'default_value': None, 'required': False, 'public': True, 'position': 1,
+        }]
+        self.stages[tournament_id] = [stage]
+        self.groups[tournament_id] = [group]
+        self.rounds[tournament_id] = []
+        self.matches[tournament_id] = []
+        self.bracket_nodes[tournament_id] = []
+        self.streams[tournament_id] = [{'id': self._id(), 'name': 'Main stream', 'url': 'https://example.com/live',
+                                        'language': 'en', '_match_ids': []}]
+        self.videos[tournament_id] = []
+
+        wins = {participant['id']: 0 for participant in participants}
+        # The opponents of the first round by seed, then the winners of the previous round. None for a bye or TBD.
+        entrants = [(participant, None) for participant in participants]
+        entrants += [(None, None)] * ((1 << rounds_count) - len(entrants))
+
+        for round_number in range(1, rounds_count + 1):
+            round_ = {'id': self._id(), 'stage_id': stage['id'], 'group_id': group['id'], 'number': round_number,
+                      'name': 'Round {}'.format(round_number), 'closed': round_number <= played_rounds,
+                      'settings': {}, '_stage_number': 1, '_group_number': 1}
+            self.rounds[tournament_id].append(round_)
+
+            winners = []
+
+            for number in range(1, len(entrants) // 2 + 1):
+                pairing = entrants[2 * number - 2:2 * number]
+                completed = round_number <= played_rounds and all(participant for participant, _ in pairing)
+                scheduled = start + timedelta(hours = round_number - 1)
+
+                match = self._match(tournament_id, stage, group, round_, number, pairing, completed, scheduled)
+                self.matches[tournament_id].append(match)
+                self.bracket_nodes[tournament_id].append(self._bracket_node(match, pairing, round_number))
+
+                winner = None
+                if completed:
+                    winner = next(opponent['participant'] for opponent in match['opponents']
+                                  if opponent['result'] == 'win')
+                    wins[winner['id']] += 1
+                    self._add_video(tournament_id, match)
+
+                winners.append((winner, match['id']))
+
+            entrants = winners
+
+        self._add_rankings(tournament_id, stage, group, participants, wins)
+
+    def _match(self, tournament_id, stage, group, round_, number, pairing, completed, scheduled):
+        scores = [self._random.randint(0, 5) for _ in pairing]
+
+        if completed and scores[0] == scores[1]:
+            scores[self._random.randint(0, 1)] += 1
+
+        opponents = []
+        for index, (participant, _) in enumerate(pairing):
+            won = completed and scores[index] == max(scores)
+            opponents.append({
+                'number': index + 1,
+                'position': index + 1,
+                'result': ('win' if won else 'loss') if completed else None,
+                'rank': (1 if won else 2) if completed else None,
+                'forfeit': False,
+                'score': scores[index] if completed else None,
+                'participant': participant,
+            })
+
+        status = 'completed' if completed else 'pending'
+
+        return {
+            'id': self._id(),
+            'stage_id': stage['id'],
+            'group_id': group['id'],
+            'round_id': round_['id'],
+            'number': number,
+            'type': 'duel',
+            'status': status,
+            'scheduled_datetime': scheduled.isoformat(),
+            'played_at': (scheduled + timedelta(minutes = 30)).isoformat() if completed else None,
+            'opponents': opponents,
+            'public_notes': None,
+            'games': [{
+                'number': 1,
+                'type': 'duel',
+                'status': status,
+                'opponents': [dict({key: opponent[key] for key in ('number', 'position', 'result', 'rank', 'forfeit',
+                                                                   'score')}, properties = {})
+                              for opponent in opponents],
+                'properties': {},
+            }],
+            '_tournament_id': tournament_id,
+            '_stage_number': stage['number'],
+            '_group_number': group['number'],
+            '_round_number': round_['number'],
+        }
+
+    @staticmethod
+    def _bracket_node(match, pairing, round_number):
+        node = {key: match[key] for key in ('id', 'stage_id', 'group_id', 'round_id', 'number', 'type', 'status',
+                                            'scheduled_datetime', 'played_at', '_group_number', '_round_number')}
+
+        node['depth'] = round_number - 1
+        node['branch'] = 'WB'
+        node['opponents'] = [{
+            'number': opponent['number'],
+            'result': opponent['result'],
+            'rank': opponent['rank'],
+            'forfeit': opponent['forfeit'],
+            'score': opponent['score'],
+            'source_type': 'winner' if source_node_id else 'none',
+            'source_node_id': source_node_id,
+            'participant': opponent['participant'],
+        } for opponent, (_, source_node_id) in zip(match['opponents'], pairing)]
+
+        return node
+
+    def _add_video(self, tournament_id, match):
+        self.videos[tournament_id].append({
+            'id': self._id(),
+            'name': 'Replay of match {}'.format(match['number']),
+            'url': 'https://example.com/videos/{}'.format(match['id']),
+            'language': 'en',
+            'category': 'replay',
+            'match_id': match['id'],
+            '_participant_ids': [opponent['participant']['id'] for opponent in match['opponents']],
+        })
+
+    def _add_rankings(self, tournament_id, stage, group, participants, wins):
+        ranked = sorted(participants, key = lambda participant: -wins[participant['id']])
+
+        self.ranking_items[tournament_id] = []
+
+        for position, participant in enumerate(ranked, 1):
+            won = wins[participant['id']]
+            played = won + (1 if won < max(wins.values()) else 0)
+
+            self.ranking_items[tournament_id].append({
+                'id': self._id(),
+                'group_id': group['id'],
+                'number': participants.index(participant) + 1,
+                'position': position,
+                'rank': position,
+                'participant': participant,
+                'points': 3 * won,
+                'properties': {'wins': won, 'draws': 0, 'losses': played - won, 'played': played, 'forfeits': 0},
+                '_stage_id': stage['id'],
+                '_group_number': group['number'],
+            })
+
+            self.standings.append({
+                'id': self._id(),
+                'position': position,
+                'rank': position,
+                'participant': participant,
+                'tournament_id': tournament_id,
+            })
+
+    def resolve(self, name, parameters):
+        """:param name The name of the method of the endpoint.
+        :param parameters The path parameters of the request.
+        :returns The records of a collection, a single record, or None if it does not exist."""
+
+        tournament_id = parameters.get('tournament_id')
+
+        if name == 'get_match':
+            return _find(self.matches.get(tournament_id), parameters['id'])
+        if name == 'get_matches_from_tournament':
+            return _without(self.matches.get(tournament_id), _DETAILED_MATCH)
+        if name == 'get_matches_from_discipline':
+            return [dict(match, tournament = self._tournament_light(match['_tournament_id']))
+                    for match in _without(self._all(self.matches), _DETAILED_MATCH)
+                    if self._tournament(match['_tournament_id'])['discipline'] == parameters['discipline_id']]
+        if name == 'get_bracket_nodes':
+            return [node for node in self.bracket_nodes.get(tournament_id, ())
+                    if node['stage_id'] == parameters['stage_id']]
+        if name == 'get_custom_fields':
+            return self.custom_fields.get(tournament_id)
+        if name == 'get_disciplines':
+            return _without(self.disciplines, _DETAILED_DISCIPLINE)
+        if name == 'get_discipline':
+            return _find(self.disciplines, parameters['id'])
+        if name == 'get_groups':
+            return self.groups.get(tournament_id)
+        if name == 'get_group':
+            return _find(self.groups.get(tournament_id), parameters['id'])
+        if name == 'get_game':
+            match = _find(self.matches.get(tournament_id), parameters['match_id'])
+            return next((game for game in match['games'] if str(game['number']) == parameters['number']), None) \
+                if match else None
+        if name == 'get_participants':
+            return self.participants.get(tournament_id)
+        if name == 'get_participant':
+            return _find(self.participants.get(tournament_id), parameters['id'])
+        if name == 'get_playlist':
+            return _find(self.playlists, parameters['id'])
+        if name == 'get_ranking_items':
+            return [item for item in self.ranking_items.get(tournament_id, ())
+                    if item['_stage_id'] == parameters['stage_id']]
+        if name == 'get_rounds':
+            return self.rounds.get(tournament_id)
+        if name == 'get_round':
+            return _find(self.rounds.get(tournament_id), parameters['id'])
+        if name == 'get_stages':
+            return self.stages.get(tournament_id)
+        if name == 'get_stage':
+            return _find(self.stages.get(tournament_id), parameters['id'])
+        if name == 'get_standings':
+            return self.standings
+        if name == 'get_streams':
+            return self.streams.get(tournament_id)
+        if name == 'get_videos':
+            return self.videos.get(tournament_id)
+        if name == 'get_videos_by_match':
+            return _without([video for video in self.videos.get(tournament_id, ())
+                             if video['match_id'] == parameters['match_id']], ('match_id',))
+        if name == 'get_tournaments_featured':
+            return _without(self.tournaments, _DETAILED_TOURNAMENT)
+        if name == 'get_tournament':
+            return _find(self.tournaments, parameters['id'])
+        if name == 'get_tournaments_by_playlist':
+            playlist = _find(self.playlists, parameters['id'])
+            return _without([tournament for tournament in self.tournaments
+                             if tournament['id'] in playlist['_tournament_ids']], _DETAILED_TOURNAMENT) \
+                if playlist else None
+
+        return None
+
+    def _tournament(self, tournament_id):
+        return _find(self.tournaments, tournament_id)
+
+    def _tournament_light(self, tournament_id):
+        tournament = self._tournament(tournament_id)
+
+        return {key: tournament[key] for key in ('id', 'name', 'full_name')}
+
+    @staticmethod
+    def _all(collections):
+        return [record for records in collections.values() for record in records]
+
+
+def _find(records, id):
+    return next((record for record in records or () if record['id'] == id), None)
+
+
+def _without(records, keys):
+    if records is None:
+        return None
+
+    return [{key: value for key, value in record.items() if key not in keys} for record in records]
+
+
+def _public(record):
+    return {key: value for key, value in record.items() if not key.startswith('_')}
+
+
+def _participant_ids(record):
+    ids = list(record.get('_participant_ids', ()))
+
+    if record.get('participant'):
+        ids.append(record['participant']['id'])
+
+    ids += [opponent['participant']['id'] for opponent in record.get('opponents', ()) if opponent.get('participant')]
+
+    return ids
+
+
+def _field(record, name):
+    return record.get(name, record.get('_' + name))
+
+
+def _scheduled(record):
+    return record.get('scheduled_datetime') or record.get('scheduled_date_start')
+
+
+def _boolean(value):
+    return value.lower() in ('1', 'true')
+
+
+FILTERS = {
+    'stage_ids': lambda record, values: _field(record, 'stage_id') in values,
+    'group_ids': lambda record, values: _field(record, 'group_id') in values,
+    'round_ids': lambda record, values: _field(record, 'round_id') in values,
+    'tournament_ids': lambda record, values: _field(record, 'tournament_id') in values,
+    'match_ids': lambda record, values: record.get('match_id') in values
+                                        or bool(values.intersection(record.get('_match_ids', ()))),
+    'participant_ids': lambda record, values: bool(values.intersection(_participant_ids(record))),
+    'stage_numbers': lambda record, values: str(_field(record, 'stage_number')) in values,
+    'group_numbers': lambda record, values: str(_field(record, 'group_number')) in values,
+    'round_numbers': lambda record, values: str(_field(record, 'round_number')) in values,
+    'statuses': lambda record, values: record.get('status') in values,
+    'disciplines': lambda record, values: record.get('discipline') in values,
+    'countries': lambda record, values: record.get('country') in values,
+    'platforms': lambda record, values: bool(values.intersection(record.get('platforms') or ())),
+    'is_scheduled': lambda record, value: bool(record.get('scheduled_datetime')) == _boolean(value),
+    'is_online': lambda record, value: bool(record.get('online')) == _boolean(value),
+    'scheduled_before': lambda record, value: bool(_scheduled(record)) and _scheduled(record)[:len(value)] <= value,
+    'scheduled_after': lambda record, value: bool(_scheduled(record)) and _scheduled(record)[:len(value)] >= value,
+    'min_depth': lambda record, value: record.get('depth', 0) >= int(value),
+    'max_depth': lambda record, value: record.get('depth', 0) <= int(value),
+    'name': lambda record, value: value.lower() in (record.get('name') or '').lower(),
+    'category': lambda record, value: record.get('category') == value,
+    'target_type': lambda record, value: record.get('target_type') == value,
+}
+"""The supported query parameters and whether a record passes them. Parameters ending with 's' take a set of values."""
+
+SORTS = {
+    'schedule': lambda records: sorted(records, key = lambda record: (not _scheduled(record), _scheduled(record) or '')),
+    'latest_results': lambda records: sorted(records, key = lambda record: record.get('played_at') or '',
+                                             reverse = True),
+    'scheduled_asc': lambda records: sorted(records, key = lambda record: _scheduled(record) or ''),
+    'scheduled_desc': lambda records: sorted(records, key = lambda record: _scheduled(record) or '', reverse = True),
+}
+"""The supported values of the sort parameter. Other values keep the structural order."""
+
+
+def _error(status, message, headers=None):
+    return web.json_response({'errors': [{'message': message, 'scope': 'query', 'type': 'error'}]}, status = status,
+                             headers = headers)
+
+
+class StubServer:
+
+    def __init__(self, data=None, *, recorded=None, latency=0.0, jitter=0.0, throttle=0.0, throttle_every=0,
+                 retry_after=1, validators=False, page_size=None, seed=0):
+        """An aiohttp server answering the endpoints of the Viewer API under /viewer/v2.
+        Collections honour the Range header and answer with a Content-Range, like the API.
+        :param data The StubData to serve. Defaults to StubData().
+        :param recorded A dict of paths (like '/tournaments/1/matches') and recorded decoded JSON, served instead of
+        the data. Recorded lists are filtered and ranged as well.
+        :param latency Seconds every response is delayed.
+        :param jitter Maximal seconds added randomly to the latency.
+        :param throttle The probability of answering 429 Too Many Requests.
+        :param throttle_every Answer every n-th request with 429 Too Many Requests. 0 disables it.
+        :param retry_after The value of the Retry-After header of 429 responses.
+        :param validators Whether to send ETag and Last-Modified headers, and answer conditional requests with
+        304 Not Modified if the response did not change. The ETag is a hash of the body, Last-Modified is `modified`.
+        :param page_size The maximal number of items of a page. Ranges of more items are answered with a shorter
+        page, which the API may also do.
+        :param seed The seed of the jitter and the throttling."""
+
+        self.data = data if data is not None else StubData()
+        self.recorded = dict(recorded or {})
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle = throttle
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.validators = validators
+        self.page_size = page_size
+        self.modified = datetime.now(timezone.utc).replace(microsecond = 0)
+
+        self.requests = 0
+        self.throttled = 0
+        self.not_modified = 0
+
+        self._random = random.Random(seed)
+        self._runner = None
+        self._thread = None
+        self._loop = None
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """:param path A JSON file with an object of paths and recorded decoded JSON.
+        :returns A StubServer serving the recorded data."""
+
+        with open(path, encoding = 'utf-8') as file:
+            return cls(recorded = json.load(file), **kwargs)
+
+    def application(self) -> web.Application:
+        """:returns The aiohttp Application of the server."""
+
+        application = web.Application()
+
+        for endpoint in VIEWER_ENDPOINTS:
+            application.router.add_route(endpoint.method, PREFIX + endpoint.path, self._handler(endpoint))
+
+        return application
+
+    def _handler(self, endpoint):
+        async def handle(request):
+            return await self._handle(endpoint, request)
+
+        return handle
+
+    async def _handle(self, endpoint, request):
+        response = await self._respond(endpoint, request)
+
+        if self.validators and response.status in (200, 206):
+            return self._validated(request, response)
+
+        return response
+
+    async def _respond(self, endpoint, request):
+        self.requests += 1
+
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if (self.throttle and self._random.random() < self.throttle) or \
+                (self.throttle_every and self.requests % self.throttle_every == 0):
+            self.throttled += 1
+            return _error(429, 'Too many requests', {'Retry-After': str(self.retry_after)})
+
+        if not request.headers.get('X-Api-Key'):
+            return _error(401, 'Missing X-Api-Key')
+
+        path = request.path[len(PREFIX):]
+        content = self.recorded[path] if path in self.recorded else self.data.resolve(endpoint.name, request.match_info)
+
+        if content is None:
+            return _error(404, 'Not found')
+
+        for query in endpoint.query:
+            if query.required and query.name not in request.query:
+                return _error(400, 'Missing query parameter {}'.format(query.name))
+
+        if not isinstance(content, list):
+            return web.json_response(_public(content))
+
+        content = self._filter(content, request.query)
+
+        if not endpoint.ranged:
+            return web.json_response([_public(record) for record in content])
+
+        return self._ranged(endpoint, content, request.headers.get('Range'))
+
+    def _validated(self, request, response):
+        """Adds the validators to a response, or answers 304 Not Modified if the request has matching ones."""
+
+        etag = '"{}"'.format(hashlib.sha1(response.body).hexdigest())
+        last_modified = format_datetime(self.modified, usegmt = True)
+
+        if_none_match = request.headers.get('If-None-Match')
+        if_modified_since = request.headers.get('If-Modified-Since')
+
+        if if_none_match is not None:
+            not_modified = etag in (tag.strip() for tag in if_none_match.split(',')) or if_none_match.strip() == '*'
+        elif if_modified_since is not None:
+            try:
+                not_modified = self.modified <= parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                not_modified = False
+        else:
+            not_modified = False
+
+        if not_modified:
+            self.not_modified += 1
+            return web.Response(status = 304, headers = {'ETag': etag, 'Last-Modified': last_modified})
+
+        response.headers['ETag'] = etag
+        response.headers['Last-Modified'] = last_modified
+
+        return response
+
+    @staticmethod
+    def _filter(records, query):
+        for name, value in query.items():
+            if name == 'sort':
+                records = SORTS[value](records) if value in SORTS else records
+            elif name in FILTERS:
+                argument = set(value.split(',')) if name.endswith('s') and not name.startswith('is_') else value
+                records = [record for record in records if FILTERS[name](record, argument)]
+
+        return records
+
+    def _ranged(self, endpoint, records, range_header):
+        total = len(records)
+
+        try:
+            unit, span = range_header.split('=')
+            start, end = (int(value) for value in span.split('-'))
+        except (AttributeError, ValueError):
+            return _error(400, 'Missing or invalid Range header')
+
+        if unit != endpoint.unit or start > end or end - start + 1 > endpoint.max_range:
+            return _error(416, 'Invalid Range {}'.format(range_header),
+                          {'Content-Range': '{} */{}'.format(endpoint.unit, total)})
+
+        if start >= total and total:
+            return _error(416, 'Range not satisfiable', {'Content-Range': '{} */{}'.format(unit, total)})
+
+        if self.page_size is not None:
+            end = min(end, start + self.page_size - 1)
+
+        page = [_public(record) for record in records[start:end + 1]]
+
+        if not page:
+            content_range = '{} */{}'.format(unit, total)
+        else:
+            content_range = '{} {}-{}/{}'.format(unit, start, start + len(page) - 1, total)
+
+        return web.json_response(page, status = 206, headers = {'Content-Range': content_range})
+
+    async def start(self, host='127.0.0.1', port=0) -> str:
+        """Starts the server in the running event loop.
+        :param port The port to listen on. 0 picks a free one.
+        :returns The base URL to pass to a connector."""
+
+        self._runner = web.AppRunner(self.application(), access_log = None)
+        await self._runner.setup()
+
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+
+        host, port = self._runner.addresses[0][:2]
+
+        return 'http://{}:{}{}'.format(host, port, PREFIX)
+
+    async def stop(self):
+        """Stops the server started with `start`."""
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @contextmanager
+    def running(self, host='127.0.0.1', port=0):
+        """Runs the server in a thread with an event loop of its own, for the time of a with-statement.
+        :returns The base URL to pass to a connector."""
+
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+        result = {}
+
+        def serve():
+            asyncio.set_event_loop(loop)
+
+            try:
+                result['base_url'] = loop.run_until_complete(self.start(host, port))
+            except Exception as error:
+                result['error'] = error
+                return
+            finally:
+                started.set()
+
+            loop.run_forever()
+            loop.run_until_complete(self.stop())
+            loop.close()
+
+        thread = threading.Thread(target = serve, name = 'StubServer', daemon = True)
+        thread.start()
+        started.wait()
+
+        if 'error' in result:
+            raise result['error']
+
+        try:
+            yield result['base_url']
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description = 'A local stand-in for the Toornament Viewer API.')
+    parser.add_argument('--host', default = '127.0.0.1')
+    parser.add_argument('--port', type = int, default = 8080)
+    parser.add_argument('--recorded', help = 'A JSON file of paths and recorded responses.')
+    parser.add_argument('--tournaments', type = int, default = 2)
+    parser.add_argument('--participants', type = int, default = 16)
+    parser.add_argument('--seed', type = int, default = 0)
+    parser.add_argument('--latency', type = float, default = 0.0)
+    parser.add_argument('--jitter', type = float, default = 0.0)
+    parser.add_argument('--throttle', type = float, default = 0.0)
+    parser.add_argument('--throttle-every', type = int, default = 0)
+    parser.add_argument('--page-size', type = int, help = 'The maximal number of items of a page.')
+    parser.add_argument('--validators', action = 'store_true',
+                        help = 'Send ETag and Last-Modified, and answer conditional requests with 304.')
+    options = parser.parse_args(arguments)
+
+    data = StubData(seed = options.seed, tournaments = options.tournaments, participants = options.participants)
+    recorded = None
+
+    if options.recorded:
+        with open(options.recorded, encoding = 'utf-8') as file:
+            recorded = json.load(file)
+
+    server = StubServer(data, recorded = recorded, latency = options.latency, jitter = options.jitter,
+                        throttle = options.throttle, throttle_every = options.throttle_every,
+                        validators = options.validators, page_size = options.page_size, seed = options.seed)
+
+    print('Serving the Viewer API at http://{}:{}{}'.format(options.host, options.port, PREFIX))
+    print('Tournaments: {}'.format(', '.join(data.tournament_ids)))
+
+    web.run_app(server.application(), host = options.host, port = options.port, print = None, access_log = None)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,58 +1,582 @@
 from abc import ABCMeta, abstractmethod
+import asyncio
+import time
+from time import perf_counter
 import requests
+from requests.adapters import HTTPAdapter
 import aiohttp
+from contextlib import contextmanager
+from functools import partial
+from .cache import request_key
+from .hydration import Hydration, IdentityMap
+from .instrumentation import RequestEvent, trace_config
+from .metrics import MetricsRegistry
+from .page import Page
+from .json_decoder import get_decoder
 
 
-class SyncToornamentConnection(metaclass=ABCMeta):
+class ToornamentConnection(metaclass=ABCMeta):
+
+    _endpoints = {}
+
+    def __init__(self, token, *, rate_limiter=None, retry_policy=None, cache=None, lazy=False, identity_map=False,
+                 raw=False, json_decoder='auto', base_url=None, on_request=None, metrics=False):
+        """The options and the bookkeeping shared by the synchron and the asynchron connection, which only differ in
+        their sessions and in how they send requests. The parameters are described in their constructors."""
 
-    def __init__(self, token):
         self.token = token
+        self.base_url = base_url.rstrip('/') if base_url else self._base_url()
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.cache = cache
+
+        self.raw = raw
+        self.on_request = list(on_request) if on_request else []
+
+        if metrics is True:
+            metrics = MetricsRegistry()
+        elif metrics is False:
+            metrics = None
+
+        self.metrics = metrics
+
+        self._decode = get_decoder(json_decoder)
+
+        if identity_map is True:
+            identity_map = IdentityMap()
+        elif identity_map is False:
+            identity_map = None
+
+        self.identity_map = identity_map
+
+        if lazy or identity_map is not None:
+            self._hydration = Hydration(lazy = lazy, identity_map = identity_map)
+        else:
+            self._hydration = None
 
     @staticmethod
     @abstractmethod
     def _base_url() -> str:
         """:returns The Base-URL of the API"""
 
-    def _simple_access(self, method, path, *, path_parameters, query_parameters, headers) -> dict:
+    def hydrate(self, method_name, content):
+        """Builds the schema objects a method would have returned from the decoded JSON it returned with `raw=True`.
+        The nested data is not copied, with `lazy=True` it is only read on first access.
+        :param method_name The name of the method, e.g. 'get_matches_from_tournament'.
+        :param content The raw content returned by the method, a Page, list or dict.
+        :returns The schema object(s), in a Page if `content` was one."""
 
-        headers['X-Api-Key'] = self.token
+        objects = self._endpoints[method_name].hydrate(content, self._hydration)
+
+        return content.with_items(objects) if isinstance(content, Page) else objects
+
+    def add_hook(self, hook):
+        """Adds a callable to `on_request`."""
+
+        self.on_request.append(hook)
+
+    def remove_hook(self, hook):
+        """Removes a callable from `on_request`."""
+
+        self.on_request.remove(hook)
+
+    def _emit(self, event):
+        event.total = perf_counter() - event.started
+
+        if self.metrics is not None:
+            self.metrics.record(event, finished = True)
 
-        url = self._base_url() + path.format(**path_parameters)
+        for hook in self.on_request:
+            hook(event)
+
+    def _format_request(self, path, path_parameters, query_parameters, headers) -> str:
+        """Adds the API-Key to `headers` and joins the lists in `query_parameters`.
+        :returns The path with the path parameters filled in."""
+
+        headers['X-Api-Key'] = self.token
 
         if query_parameters:
             for name, param in query_parameters.items():
                 if isinstance(param, list):
                     query_parameters[name] = ','.join(param)
 
-        response = requests.request(method, url, headers = headers, params = query_parameters)
+        return path.format(**path_parameters)
 
-        response.raise_for_status()
+    def _cache_lookup(self, key, headers, event):
+        """:param event The RequestEvent to record the cache hit in, if the call is traced.
+        :returns Tuple of the cache entry of the request or None, and whether it is fresh. The validators of a stale
+        entry are added to `headers`, to revalidate it."""
 
-        return response.json()
+        entry = self.cache.get(key)
 
+        if entry is None:
+            return None, False
 
-class AsyncToornamentConnection(metaclass=ABCMeta):
+        if entry.is_fresh:
+            if event is not None:
+                event.cache = 'hit'
+            return entry, True
 
-    def __init__(self, token):
-        self.token = token
+        headers.update(entry.conditional_headers())
 
-    @staticmethod
-    @abstractmethod
-    def _base_url() -> str:
-        """:returns The Base-URL of the API"""
+        return entry, False
+
+    def _cache_store(self, key, path, entry, content, response_headers, size, event):
+        """Stores a response in the cache, or renews the stale `entry` if the API answered 304 Not Modified.
+        :returns Tuple of the decoded content and the headers of the response."""
+
+        if size is None and entry is not None:
+            if event is not None:
+                event.cache = 'revalidated'
+            self.cache.revalidated(path, entry)
+            return entry.content, entry.headers
+
+        if event is not None:
+            event.cache = 'miss'
+        self.cache.set(key, path, content, response_headers, size)
+
+        return content, response_headers
+
+    @contextmanager
+    def _tracing(self, method, path):
+        """Records a call of an endpoint method in a RequestEvent, which is emitted when the call is done or raised.
+        :returns A context manager giving the RequestEvent."""
+
+        event = RequestEvent(method, path)
+
+        if self.metrics is not None:
+            self.metrics.started(event)
+
+        try:
+            yield event
+        except Exception as error:
+            event.error = error
+            self._emit(event)
+            raise
+
+        self._emit(event)
+
+    def _traced_result(self, event, content, response_headers, hydrate, range):
+        """:param hydrate A callable building the schema objects from the content and a Hydration, or None for raw content.
+        :param range The requested Range, if the endpoint takes one.
+        :returns The content, or a Page if a Range was requested. The time of the hydration is recorded in `event`."""
+
+        if hydrate is not None:
+            start = perf_counter()
+            content = hydrate(content, self._hydration)
+            event.hydrate = perf_counter() - start
+
+        return Page(content, response_headers.get('Content-Range'), range) if range is not None else content
+
+
+class SyncToornamentConnection(ToornamentConnection):
+
+    def __init__(self, token, *, pool_connections=10, pool_maxsize=10, max_retries=0, rate_limiter=None,
+                 retry_policy=None, cache=None, lazy=False, identity_map=False, raw=False,
+                 json_decoder='auto', base_url=None, on_request=None, metrics=False):
+        """
+        :param token The API-Key used to authenticate against the API.
+        :param pool_connections The number of connection pools to cache.
+        :param pool_maxsize The maximal number of connections kept open per pool.
+        :param max_retries The number of retries for failed connections, passed to the HTTPAdapter.
+        :param rate_limiter A RateLimiter every request has to pass before it is sent.
+        :param retry_policy A RetryPolicy for responses with transient errors and failed connections.
+        :param cache A ResponseCache to answer repeated requests from.
+        :param lazy Whether nested objects of the returned schema objects are only built on first access.
+        :param identity_map Whether participants with the same id are resolved to one instance, which is updated in place.
+        Takes an IdentityMap to share it with other connectors.
+        :param raw Whether to return the decoded JSON instead of schema objects. Can be overridden per call.
+        :param json_decoder The JSON library decoding the responses: 'orjson', 'ujson', 'json', a callable decoding
+        bytes, or 'auto' for the fastest one installed.
+        :param base_url The URL the paths of the endpoints are appended to, to use another server than the API, like
+        a StubServer. Defaults to the URL of the API.
+        :param on_request A list of callables. Each is called with a RequestEvent after every call of an endpoint method.
+        :param metrics Whether to keep counters and latency histograms of the endpoints in a MetricsRegistry. Takes a
+        MetricsRegistry to share it with other connectors.
+        """
+        super().__init__(token, rate_limiter = rate_limiter, retry_policy = retry_policy, cache = cache, lazy = lazy,
+                         identity_map = identity_map, raw = raw, json_decoder = json_decoder, base_url = base_url,
+                         on_request = on_request, metrics = metrics)
+
+        adapter = HTTPAdapter(pool_connections = pool_connections, pool_maxsize = pool_maxsize,
+                              max_retries = max_retries)
+
+        self._session = requests.Session()
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+    def close(self):
+        """Closes the underlying session and all pooled connections."""
+
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _request(self, method, path, *, path_parameters, query_parameters, headers, event=None):
+        """:param event The RequestEvent to record the call in, if it is traced.
+        :returns Tuple of the decoded content and the headers of the response."""
+
+        formatted_path = self._format_request(path, path_parameters, query_parameters, headers)
+
+        if self.cache is None:
+            content, response_headers, _ = self._send(method, formatted_path, query_parameters, headers, event)
+            return content, response_headers
+
+        key = request_key(method, formatted_path, query_parameters, headers.get('Range'))
+
+        entry, fresh = self._cache_lookup(key, headers, event)
+        if fresh:
+            return entry.content, entry.headers
+
+        content, response_headers, size = self._send(method, formatted_path, query_parameters, headers, event)
+
+        return self._cache_store(key, path, entry, content, response_headers, size, event)
+
+    def _send(self, method, formatted_path, query_parameters, headers, event=None):
+        """Sends the request, respecting the rate limiter and the retry policy.
+        :param event The RequestEvent to record the request in, if it is traced.
+        :returns Tuple of the decoded content, the headers of the response and the size of its body.
+        Content and size are None if the API answered 304 Not Modified."""
+
+        url = self.base_url + formatted_path
+
+        if event is not None:
+            event.url = url
+
+        attempt = 1
+
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            try:
+                response = self._session.request(method, url, headers = headers, params = query_parameters)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                delay = self.retry_policy.retry_delay(method, url, attempt, error = error) if self.retry_policy else None
+                if delay is None:
+                    raise
+            else:
+                if event is not None:
+                    event.status = response.status_code
+                    event.ttfb = response.elapsed.total_seconds()
+
+                if response.status_code == 429 and self.rate_limiter is not None:
+                    self.rate_limiter.honour_retry_after(response.headers.get('Retry-After'))
+
+                delay = None
+                if response.status_code >= 400 and self.retry_policy is not None:
+                    delay = self.retry_policy.retry_delay(method, url, attempt, status = response.status_code,
+                                                          retry_after = response.headers.get('Retry-After'))
+
+                if delay is None:
+                    response.raise_for_status()
+
+                    if response.status_code == 304:
+                        return None, response.headers, None
+
+                    body = response.content
+
+                    if event is None:
+                        return self._decode(body), response.headers, len(body)
+
+                    start = perf_counter()
+                    content = self._decode(body)
+                    event.decode = perf_counter() - start
+                    event.bytes = len(body)
+
+                    return content, response.headers, len(body)
+
+                response.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+            if event is not None:
+                event.retries += 1
+
+    def _simple_access(self, method, path, *, path_parameters, query_parameters, headers) -> dict:
+
+        return self._request(method, path, path_parameters = path_parameters, query_parameters = query_parameters,
+                             headers = headers)[0]
+
+    def _ranged_access(self, method, path, *, path_parameters, query_parameters, headers):
+        """:returns Tuple of the decoded content and the value of the Content-Range header."""
+
+        content, response_headers = self._request(method, path, path_parameters = path_parameters,
+                                                  query_parameters = query_parameters, headers = headers)
+
+        return content, response_headers.get('Content-Range')
+
+    def _traced_access(self, method, path, *, path_parameters, query_parameters, headers, hydrate, range=None):
+        """Like `_simple_access` or `_ranged_access`, but records the call in a RequestEvent for the hooks.
+        :param hydrate A callable building the schema objects from the content and a Hydration, or None for raw content.
+        :param range The requested Range, if the endpoint takes one.
+        :returns The content, or a Page if a Range was requested."""
+
+        with self._tracing(method, path) as event:
+            content, response_headers = self._request(method, path, path_parameters = path_parameters,
+                                                      query_parameters = query_parameters, headers = headers,
+                                                      event = event)
+
+            return self._traced_result(event, content, response_headers, hydrate, range)
+
+
+async def _close_finally(session):
+    """An asynchron generator closing `session` when it is finalized. Event loops finalize the asynchron generators
+    started in them when they shut down, like at the end of `asyncio.run()`, or when the generator is garbage
+    collected, so the session and its pooled connections are closed in their own loop."""
+
+    try:
+        yield
+    finally:
+        await session.close()
+
+
+def _start(generator):
+    """Runs an asynchron generator up to its first yield, which does not await anything, and registers it with the
+    running event loop.
+    :returns The generator."""
+
+    try:
+        generator.asend(None).send(None)
+    except StopIteration:
+        pass
+
+    return generator
+
+
+class AsyncToornamentConnection(ToornamentConnection):
+
+    def __init__(self, token, *, limit=100, limit_per_host=0, keepalive_timeout=15, ttl_dns_cache=300,
+                 rate_limiter=None, retry_policy=None, cache=None, coalesce_requests=True, lazy=False,
+                 identity_map=False, raw=False, json_decoder='auto', base_url=None,
+                 on_request=None, metrics=False):
+        """
+        :param token The API-Key used to authenticate against the API.
+        :param limit The maximal number of simultaneous connections. 0 means no limit.
+        :param limit_per_host The maximal number of simultaneous connections to the same host. 0 means no limit.
+        :param keepalive_timeout Seconds an idle connection is kept open for reuse.
+        :param ttl_dns_cache Seconds a resolved DNS entry is cached. None caches forever.
+        :param rate_limiter A RateLimiter every request has to pass before it is sent.
+        :param retry_policy A RetryPolicy for responses with transient errors and failed connections.
+        :param cache A ResponseCache to answer repeated requests from.
+        :param coalesce_requests Whether identical requests that are sent at the same time share one response.
+        :param lazy Whether nested objects of the returned schema objects are only built on first access.
+        :param identity_map Whether participants with the same id are resolved to one instance, which is updated in place.
+        Takes an IdentityMap to share it with other connectors.
+        :param raw Whether to return the decoded JSON instead of schema objects. Can be overridden per call.
+        :param json_decoder The JSON library decoding the responses: 'orjson', 'ujson', 'json', a callable decoding
+        bytes, or 'auto' for the fastest one installed.
+        :param base_url The URL the paths of the endpoints are appended to, to use another server than the API, like
+        a StubServer. Defaults to the URL of the API.
+        :param on_request A list of callables. Each is called with a RequestEvent after every call of an endpoint method.
+        :param metrics Whether to keep counters and latency histograms of the endpoints in a MetricsRegistry. Takes a
+        MetricsRegistry to share it with other connectors.
+        """
+        super().__init__(token, rate_limiter = rate_limiter, retry_policy = retry_policy, cache = cache, lazy = lazy,
+                         identity_map = identity_map, raw = raw, json_decoder = json_decoder, base_url = base_url,
+                         on_request = on_request, metrics = metrics)
+
+        self.coalesce_requests = coalesce_requests
+        self._in_flight = {}
+
+        self._connector_options = {
+            'limit': limit,
+            'limit_per_host': limit_per_host,
+            'keepalive_timeout': keepalive_timeout,
+            'ttl_dns_cache': ttl_dns_cache,
+            'use_dns_cache': True,
+        }
+        self._session = None
+        self._session_loop = None
+        self._session_guard = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """:returns The session shared by all requests of this connection. It is created on first use, because
+        aiohttp binds it to the running event loop, and created again if the connection is used in another loop."""
+
+        # Called from coroutines only, so this is the running loop.
+        loop = asyncio.get_event_loop()
+
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session_loop = loop
+            connector = aiohttp.TCPConnector(**self._connector_options)
+            # Tracing costs time on every request, so it is only enabled if there are hooks or metrics to report to.
+            trace_configs = [trace_config()] if self.on_request or self.metrics is not None else None
+            self._session = aiohttp.ClientSession(connector = connector, trace_configs = trace_configs)
+            # Replacing the guard of a previous session lets its loop close that session.
+            self._session_guard = _start(_close_finally(self._session))
+
+        return self._session
+
+    async def aclose(self):
+        """Closes the underlying session and all pooled connections. The connection can be used again afterwards,
+        a new session is then created on demand.
+        A session left open is closed by its event loop, when the loop shuts down with `asyncio.run()` or
+        `loop.shutdown_asyncgens()`, or when the session is replaced in another loop."""
+
+        guard, self._session, self._session_guard = self._session_guard, None, None
+
+        if guard is not None and self._session_loop is asyncio.get_event_loop():
+            await guard.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def _request(self, method, path, *, path_parameters, query_parameters, headers, event=None):
+        """:param event The RequestEvent to record the call in, if it is traced.
+        :returns Tuple of the decoded content and the headers of the response."""
+
+        formatted_path = self._format_request(path, path_parameters, query_parameters, headers)
+
+        if self.cache is None and not self.coalesce_requests:
+            content, response_headers, _ = await self._send(method, formatted_path, query_parameters, headers, event)
+            return content, response_headers
+
+        key = request_key(method, formatted_path, query_parameters, headers.get('Range'))
+
+        if not self.coalesce_requests:
+            return await self._cached_request(key, method, path, formatted_path, query_parameters, headers, event)
+
+        in_flight = self._in_flight.get(key)
+        coalesced = in_flight is not None
+
+        if not coalesced:
+            # The shared request records into an event of its own, because the callers may be cancelled or emit their
+            # events before it is done. Every caller copies it into its own event.
+            shared = RequestEvent(method, path) if event is not None else None
+            task = asyncio.ensure_future(
+                self._cached_request(key, method, path, formatted_path, query_parameters, headers, shared))
+            task.add_done_callback(partial(self._request_done, key))
+            in_flight = self._in_flight[key] = (task, shared)
+
+        task, shared = in_flight
+
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if event is not None and task.done():
+                if shared is not None:
+                    event.copy_response(shared)
+                if coalesced:
+                    event.cache = 'coalesced'
+
+    def _request_done(self, key, task):
+        """Removes a finished request from the in-flight requests."""
+
+        self._in_flight.pop(key, None)
+
+        if not task.cancelled():
+            # Marks the exception as retrieved, in case every caller was cancelled in the meantime.
+            task.exception()
+
+    async def _cached_request(self, key, method, path, formatted_path, query_parameters, headers, event=None):
+        """:returns Tuple of the decoded content and the headers of the response, from the cache if possible."""
+
+        if self.cache is None:
+            content, response_headers, _ = await self._send(method, formatted_path, query_parameters, headers, event)
+            return content, response_headers
+
+        entry, fresh = self._cache_lookup(key, headers, event)
+        if fresh:
+            return entry.content, entry.headers
+
+        content, response_headers, size = await self._send(method, formatted_path, query_parameters, headers, event)
+
+        return self._cache_store(key, path, entry, content, response_headers, size, event)
+
+    async def _send(self, method, formatted_path, query_parameters, headers, event=None):
+        """Sends the request, respecting the rate limiter and the retry policy.
+        :param event The RequestEvent to record the request in, if it is traced.
+        :returns Tuple of the decoded content, the headers of the response and the size of its body.
+        Content and size are None if the API answered 304 Not Modified."""
+
+        url = self.base_url + formatted_path
+
+        if event is not None:
+            event.url = url
+
+        session = self._get_session()
+
+        attempt = 1
+
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+
+            try:
+                async with session.request(method, url, headers = headers, params = query_parameters,
+                                           trace_request_ctx = event) as response:
+                    if event is not None:
+                        event.status = response.status
+
+                    if response.status == 429 and self.rate_limiter is not None:
+                        self.rate_limiter.honour_retry_after(response.headers.get('Retry-After'))
+
+                    delay = None
+                    if response.status >= 400 and self.retry_policy is not None:
+                        delay = self.retry_policy.retry_delay(method, url, attempt, status = response.status,
+                                                              retry_after = response.headers.get('Retry-After'))
+
+                    if delay is None:
+                        response.raise_for_status()
+
+                        if response.status == 304:
+                            return None, response.headers, None
+
+                        body = await response.read()
+
+                        if event is None:
+                            return self._decode(body), response.headers, len(body)
+
+                        start = perf_counter()
+                        content = self._decode(body)
+                        event.decode = perf_counter() - start
+                        event.bytes = len(body)
+
+                        return content, response.headers, len(body)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
+                delay = self.retry_policy.retry_delay(method, url, attempt, error = error) if self.retry_policy else None
+                if delay is None:
+                    raise
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+            if event is not None:
+                event.retries += 1
 
     async def _simple_access(self, method, path, *, path_parameters, query_parameters, headers) -> dict:
 
-        headers['X-Api-Key'] = self.token
+        content, _ = await self._request(method, path, path_parameters = path_parameters,
+                                         query_parameters = query_parameters, headers = headers)
 
-        url = self._base_url() + path.format(**path_parameters)
+        return content
 
-        if query_parameters:
-            for name, param in query_parameters.items():
-                if isinstance(param, list):
-                    query_parameters[name] = ','.join(param)
+    async def _ranged_access(self, method, path, *, path_parameters, query_parameters, headers):
+        """:returns Tuple of the decoded content and the value of the Content-Range header."""
+
+        content, response_headers = await self._request(method, path, path_parameters = path_parameters,
+                                                        query_parameters = query_parameters, headers = headers)
+
+        return content, response_headers.get('Content-Range')
+
+    async def _traced_access(self, method, path, *, path_parameters, query_parameters, headers, hydrate, range=None):
+        """Like `_simple_access` or `_ranged_access`, but records the call in a RequestEvent for the hooks.
+        :param hydrate A callable building the schema objects from the content and a Hydration, or None for raw content.
+        :param range The requested Range, if the endpoint takes one.
+        :returns The content, or a Page if a Range was requested."""
+
+        with self._tracing(method, path) as event:
+            content, response_headers = await self._request(method, path, path_parameters = path_parameters,
+                                                            query_parameters = query_parameters, headers = headers,
+                                                            event = event)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.request(method, url, headers = headers, params = query_parameters) as response:
-                response.raise_for_status()
-                return await response.json()
+            return self._traced_result(event, content, response_headers, hydrate, range)
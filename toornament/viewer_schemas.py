@@ -1,8 +1,11 @@
 from .converter import Converter
+from .hydration import LazyAttribute, nested, converted
 
 
 class Participant:
 
+    __slots__ = ('id', 'name', 'custom_fields', '__weakref__')
+
     def __init__(self, *, id, name, custom_fields):
         """
         :param id string The id of the participant.
@@ -17,6 +20,8 @@ class Participant:
 
 class Opponent:
 
+    __slots__ = ('number', 'position', 'result', 'rank', 'forfeit', 'score', 'properties')
+
     def __init__(self, *, number, position=None, result=None, rank=None, forfeit, score=None, properties=None):
         """
         :param number integer A relative identifier between 1 and the total number of participants, it is unique and determined by the seeding.
@@ -29,7 +34,7 @@ class Opponent:
 
         self.number = number
         self.position = position
-        self.result = result
+        self.result = Converter.symbol(result)
         self.rank = rank
         self.forfeit = forfeit
         self.score = score
@@ -38,6 +43,10 @@ class Opponent:
 
 class MatchOpponent(Opponent):
 
+    __slots__ = ('_participant',)
+
+    participant = LazyAttribute()
+
     def __init__(self, *, participant=None, **kwargs):
         """
         :param participant The participant identified with this opponent.
@@ -45,11 +54,13 @@ class MatchOpponent(Opponent):
 
         super().__init__(**kwargs)
 
-        self.participant = Participant(**participant) if participant else None
+        self.participant = nested(Participant, participant, shared = True)
 
 
 class MatchGameOpponent(Opponent):
 
+    __slots__ = ()
+
     def __init__(self, *, properties, **kwargs):
         """
         :param properties object Opponent properties depending on the discipline features (champion, spells...).
@@ -62,6 +73,10 @@ class MatchGameOpponent(Opponent):
 
 class Game:
 
+    __slots__ = ('number', 'type', 'status', '_opponents', 'properties')
+
+    opponents = LazyAttribute()
+
     def __init__(self, *, number, type=None, status, opponents, properties):
         """
         :param number integer A relative identifier between 1 and the total number of games, to identify the game within the match.
@@ -71,14 +86,21 @@ class Game:
         """
 
         self.number = number
-        self.type = type
-        self.status = status
-        self.opponents = [MatchGameOpponent(**opponent) for opponent in opponents]
+        self.type = Converter.symbol(type)
+        self.status = Converter.symbol(status)
+        self.opponents = nested(MatchGameOpponent, opponents, many = True)
         self.properties = properties
 
 
 class Match:
 
+    __slots__ = ('id', 'stage_id', 'group_id', 'round_id', 'number', 'type', 'status', '_scheduled_datetime',
+                 '_played_at', '_opponents')
+
+    scheduled_datetime = LazyAttribute()
+    played_at = LazyAttribute()
+    opponents = LazyAttribute()
+
     def __init__(self, *, id, stage_id, group_id, round_id, number, type, status, scheduled_datetime=None,
                  played_at=None, opponents):
         """
@@ -89,8 +111,8 @@ class Match:
         :param number integer The match number (a relative identifier within a round).
         :param type string The match type.
         :param status string The status of the match.
-        :param scheduled_datetime string The scheduled date of the match in RFC 3339 (combined date, time and utc offset).
-        :param played_at string The timestamp on which the match was played (a result was provided) in RFC 3339 (combined date, time and utc offset).
+        :param scheduled_datetime string The scheduled date of the match in RFC 3339 (combined date, time and utc offset). The attribute is a timezone-aware datetime.
+        :param played_at string The timestamp on which the match was played (a result was provided) in RFC 3339 (combined date, time and utc offset). The attribute is a timezone-aware datetime.
         :param opponents array List of match opponents.
         """
 
@@ -99,15 +121,19 @@ class Match:
         self.group_id = int(group_id)
         self.round_id = int(round_id)
         self.number = number
-        self.type = type
-        self.status = status
-        self.scheduled_datetime = Converter.datetime(scheduled_datetime)
-        self.played_at = Converter.datetime(played_at)
-        self.opponents = [MatchOpponent(**opponent) for opponent in opponents]
+        self.type = Converter.symbol(type)
+        self.status = Converter.symbol(status)
+        self.scheduled_datetime = converted(Converter.datetime, scheduled_datetime)
+        self.played_at = converted(Converter.datetime, played_at)
+        self.opponents = nested(MatchOpponent, opponents, many = True)
 
 
 class MatchDetailed(Match):
 
+    __slots__ = ('public_notes', '_games')
+
+    games = LazyAttribute()
+
     def __init__(self, *, public_notes=None, games, **kwargs):
         """
         :param public_notes string Public note of a match, written by the organizer.
@@ -117,11 +143,13 @@ class MatchDetailed(Match):
         super().__init__(**kwargs)
 
         self.public_notes = public_notes
-        self.games = [Game(**game) for game in games]
+        self.games = nested(Game, games, many = True)
 
 
 class TournamentLight:
 
+    __slots__ = ('id', 'name', 'full_name')
+
     def __init__(self, *, id, name, full_name=None):
         """
         :param id string The unique identifier of the tournament.
@@ -136,17 +164,25 @@ class TournamentLight:
 
 class MatchDiscipline(Match):
 
+    __slots__ = ('_tournament',)
+
+    tournament = LazyAttribute()
+
     def __init__(self, *, tournament, **kwargs):
         """
         :param tournament
         """
 
         super().__init__(**kwargs)
-        self.tournament = TournamentLight(**tournament)
+        self.tournament = nested(TournamentLight, tournament)
 
 
 class BracketNodeOpponent:
 
+    __slots__ = ('number', 'result', 'rank', 'forfeit', 'score', 'source_type', 'source_node_id', '_participant')
+
+    participant = LazyAttribute()
+
     def __init__(self, *, number, result=None, rank=None, forfeit, score=None, source_type, source_node_id=None,
                  participant):
         """
@@ -161,17 +197,24 @@ class BracketNodeOpponent:
         """
 
         self.number = number
-        self.result = result
+        self.result = Converter.symbol(result)
         self.rank = rank
         self.forfeit = forfeit
         self.score = score
-        self.source_type = source_type
+        self.source_type = Converter.symbol(source_type)
         self.source_node_id = int(source_node_id) if source_node_id else None
-        self.participant = Participant(**participant) if participant else None
+        self.participant = nested(Participant, participant, shared = True)
 
 
 class BracketNode:
 
+    __slots__ = ('id', 'stage_id', 'group_id', 'round_id', 'number', 'type', 'status', '_scheduled_datetime',
+                 '_played_at', 'depth', 'branch', '_opponents')
+
+    scheduled_datetime = LazyAttribute()
+    played_at = LazyAttribute()
+    opponents = LazyAttribute()
+
     def __init__(self, *, id, stage_id, group_id, round_id, number, type, status, scheduled_datetime=None,
                  played_at=None, depth, branch=None, opponents):
         """
@@ -182,8 +225,8 @@ class BracketNode:
         :param number integer The match number (a relative identifier within a round).
         :param type string The match type.
         :param status string The status of the match.
-        :param scheduled_datetime string The scheduled date of the match in RFC 3339 (combined date, time and utc offset).
-        :param played_at string The timestamp on which the match was played (a result was provided) in RFC 3339 (combined date, time and utc offset).
+        :param scheduled_datetime string The scheduled date of the match in RFC 3339 (combined date, time and utc offset). The attribute is a timezone-aware datetime.
+        :param played_at string The timestamp on which the match was played (a result was provided) in RFC 3339 (combined date, time and utc offset). The attribute is a timezone-aware datetime.
         :param depth integer The depth of the node in the bracket.
         :param branch string The core branch of the node in the bracket.
         :param opponents array List of match opponents.
@@ -194,17 +237,19 @@ class BracketNode:
         self.group_id = int(group_id)
         self.round_id = int(round_id)
         self.number = number
-        self.type = type
-        self.status = status
-        self.scheduled_datetime = Converter.datetime(scheduled_datetime)
-        self.played_at = Converter.datetime(played_at)
+        self.type = Converter.symbol(type)
+        self.status = Converter.symbol(status)
+        self.scheduled_datetime = converted(Converter.datetime, scheduled_datetime)
+        self.played_at = converted(Converter.datetime, played_at)
         self.depth = depth
-        self.branch = branch
-        self.opponents = [BracketNodeOpponent(**opponent) for opponent in opponents]
+        self.branch = Converter.symbol(branch)
+        self.opponents = nested(BracketNodeOpponent, opponents, many = True)
 
 
 class CustomField:
 
+    __slots__ = ('machine_name', 'label', 'target_type', 'type', 'default_value', 'required', 'public', 'position')
+
     def __init__(self, *, machine_name, label, target_type, type, default_value=None, required, public, position):
         """
         :param machine_name string A name used to identify a custom field for computing purposes.
@@ -229,6 +274,8 @@ class CustomField:
 
 class Discipline:
 
+    __slots__ = ('id', 'name', 'shortname', 'fullname', 'copyrights')
+
     def __init__(self, *, id, name, shortname, fullname, copyrights):
         """
         :param id string An identifier for a discipline, can be used in others APIs.
@@ -247,6 +294,8 @@ class Discipline:
 
 class DisciplineFeature:
 
+    __slots__ = ('name', 'type', 'options')
+
     def __init__(self, *, name, type, options):
         """
         :param name string Name of the feature.
@@ -261,6 +310,8 @@ class DisciplineFeature:
 
 class TeamSize:
 
+    __slots__ = ('min', 'max')
+
     def __init__(self, *, min, max):
         """Sets the minimum and maximum of players in a team
         :param min integer Minimal size of a team in the tournament.
@@ -273,6 +324,12 @@ class TeamSize:
 
 class DisciplineDetailed(Discipline):
 
+    __slots__ = ('platforms_available', '_team_size', '_features')
+
+    team_size = LazyAttribute()
+
+    features = LazyAttribute()
+
     def __init__(self, *, platforms_available, team_size, features, **kwargs):
         """
         :param platforms_available array A list of platforms available of this discipline.
@@ -282,13 +339,15 @@ class DisciplineDetailed(Discipline):
 
         super().__init__(**kwargs)
 
-        self.platforms_available = platforms_available
-        self.team_size = TeamSize(**team_size)
-        self.features = [DisciplineFeature(**feature) for feature in features]
+        self.platforms_available = Converter.symbols(platforms_available)
+        self.team_size = nested(TeamSize, team_size)
+        self.features = nested(DisciplineFeature, features, many = True)
 
 
 class Group:
 
+    __slots__ = ('id', 'stage_id', 'number', 'name', 'closed', 'settings')
+
     def __init__(self, *, id, stage_id, number, name, closed, settings):
         """
         :param id string The id of the group.
@@ -309,6 +368,8 @@ class Group:
 
 class ParticipantPlayer:
 
+    __slots__ = ('id', 'name', 'custom_fields')
+
     def __init__(self, *, id, name, custom_fields):
         """
         :param id string The id of the participant.
@@ -323,6 +384,8 @@ class ParticipantPlayer:
 
 class TeamPlayerParticipant:
 
+    __slots__ = ('name', 'custom_fields')
+
     def __init__(self, *, name, custom_fields):
         """
         :param name string The name of the team player.
@@ -335,6 +398,10 @@ class TeamPlayerParticipant:
 
 class ParticipantTeam(ParticipantPlayer):
 
+    __slots__ = ('_lineup',)
+
+    lineup = LazyAttribute()
+
     def __init__(self, *, lineup, **kwargs):
         """
         :param lineup array A list of players in a team (Only if the tournament participant type is “team”).
@@ -342,11 +409,13 @@ class ParticipantTeam(ParticipantPlayer):
 
         super().__init__(**kwargs)
 
-        self.lineup = [TeamPlayerParticipant(**player) for player in lineup]
+        self.lineup = nested(TeamPlayerParticipant, lineup, many = True)
 
 
 class Playlist:
 
+    __slots__ = ('id', 'name', 'description')
+
     def __init__(self, *, id, name, description=None):
         """
         :param id string A unique identifier for the playlist.
@@ -361,6 +430,8 @@ class Playlist:
 
 class RankingItemProperties:
 
+    __slots__ = ('wins', 'draws', 'losses', 'played', 'forfeits', 'undocumented_properties')
+
     def __init__(self, *, wins, draws, losses, played, forfeits, **undocumented_properties):
         """
         :param wins integer
@@ -381,6 +452,8 @@ class RankingItemProperties:
 
 class RankingItemPropertiesWithScore(RankingItemProperties):
 
+    __slots__ = ('score_for', 'score_against', 'score_difference')
+
     def __init__(self, *, score_for, score_against, score_difference, **kwargs):
         """
         :param score_for integer
@@ -397,6 +470,8 @@ class RankingItemPropertiesWithScore(RankingItemProperties):
 
 class RankingItemPropertiesSwiss(RankingItemProperties):
 
+    __slots__ = ('match_history',)
+
     def __init__(self, *, match_history, **kwargs):
         """
         :param match_history string
@@ -409,6 +484,10 @@ class RankingItemPropertiesSwiss(RankingItemProperties):
 
 class RankingItem:
 
+    __slots__ = ('id', 'group_id', 'number', 'position', 'rank', '_participant', 'points', 'properties')
+
+    participant = LazyAttribute()
+
     def __init__(self, *, id, group_id, number, position, rank=None, participant=None, points, properties):
         """
         :param id string The id of the ranking item.
@@ -426,7 +505,7 @@ class RankingItem:
         self.number = number
         self.position = position
         self.rank = rank
-        self.participant = Participant(**participant) if participant else None
+        self.participant = nested(Participant, participant, shared = True)
         self.points = points
 
         if properties.get('score_for') and properties.get('score_against') and properties.get('score_difference'):
@@ -439,6 +518,8 @@ class RankingItem:
 
 class Round:
 
+    __slots__ = ('id', 'stage_id', 'group_id', 'number', 'name', 'closed', 'settings')
+
     def __init__(self, *, id, stage_id, group_id, number, name, closed, settings):
         """
         :param id string The id of the round.
@@ -461,6 +542,8 @@ class Round:
 
 class Stage:
 
+    __slots__ = ('id', 'number', 'name', 'type', 'closed', 'settings')
+
     def __init__(self, *, id, number, name, type, closed, settings):
         """
         :param id string The id of the stage.
@@ -474,13 +557,17 @@ class Stage:
         self.id = int(id)
         self.number = number
         self.name = name
-        self.type = type
+        self.type = Converter.symbol(type)
         self.closed = closed
         self.settings = settings
 
 
 class StandingItem:
 
+    __slots__ = ('id', 'position', 'rank', '_participant', 'tournament_id')
+
+    participant = LazyAttribute()
+
     def __init__(self, *, id, position, rank=None, participant=None, tournament_id):
         """
         :param id string A unique identifier for the standing item.
@@ -493,12 +580,14 @@ class StandingItem:
         self.id = int(id)
         self.position = position
         self.rank = rank
-        self.participant = Participant(**participant) if participant else None
+        self.participant = nested(Participant, participant, shared = True)
         self.tournament_id = int(tournament_id)
 
 
 class Stream:
 
+    __slots__ = ('id', 'name', 'url', 'language')
+
     def __init__(self, *, id, name, url, language):
         """
         :param id string An identifier for a stream.
@@ -510,11 +599,13 @@ class Stream:
         self.id = int(id)
         self.name = name
         self.url = url
-        self.language = language
+        self.language = Converter.symbol(language)
 
 
 class Video:
 
+    __slots__ = ('id', 'name', 'url', 'language', 'category')
+
     def __init__(self, *, id, name, url, language, category):
         """
         :param id string An identifier for a video.
@@ -527,12 +618,14 @@ class Video:
         self.id = int(id)
         self.name = name
         self.url = url
-        self.language = language
-        self.category = category
+        self.language = Converter.symbol(language)
+        self.category = Converter.symbol(category)
 
 
 class VideoTournament(Video):
 
+    __slots__ = ('match_id',)
+
     def __init__(self, *, match_id=None, **kwargs):
         """
         :param match_id string The match's identifier of this video.
@@ -545,6 +638,8 @@ class VideoTournament(Video):
 
 class TournamentLogo:
 
+    __slots__ = ('logo_small', 'logo_medium', 'logo_large', 'original')
+
     def __init__(self, *, logo_small, logo_medium, logo_large, original):
         """
         :param logo_small string URL of the small version of  the tournament logo.
@@ -561,6 +656,16 @@ class TournamentLogo:
 
 class Tournament:
 
+    __slots__ = ('id', 'discipline', 'name', 'full_name', 'status', '_scheduled_date_start', '_scheduled_date_end',
+                 'timezone', 'public', 'size', 'online', 'location', 'country', 'platforms', '_logo',
+                 'registration_enabled', '_registration_opening_datetime', '_registration_closing_datetime')
+
+    scheduled_date_start = LazyAttribute()
+    scheduled_date_end = LazyAttribute()
+    logo = LazyAttribute()
+    registration_opening_datetime = LazyAttribute()
+    registration_closing_datetime = LazyAttribute()
+
     def __init__(self, *, id, discipline, name, full_name=None, status, scheduled_date_start=None,
                  scheduled_date_end=None, timezone, public, size, online=None, location=None, country=None, platforms,
                  logo, registration_enabled, registration_opening_datetime=None, registration_closing_datetime=None):
@@ -570,8 +675,8 @@ class Tournament:
         :param name string The name of the tournament.
         :param full_name string The complete name of the tournament.
         :param status string The status of the tournament
-        :param scheduled_date_start string A starting date in ISO 8601 format (only the date part, with YYYY-MM-DD pattern).
-        :param scheduled_date_end string An ending date in ISO 8601 format (only the date part, with YYYY-MM-DD pattern).
+        :param scheduled_date_start string A starting date in ISO 8601 format (only the date part, with YYYY-MM-DD pattern). The attribute is a date.
+        :param scheduled_date_end string An ending date in ISO 8601 format (only the date part, with YYYY-MM-DD pattern). The attribute is a date.
         :param timezone string A time zone from the IANA tz database.
         :param public boolean Whether the tournament is published.
         :param size integer The expected number of participants in the tournament.
@@ -581,32 +686,35 @@ class Tournament:
         :param platforms array A list of platforms on which the tournament can be played.
         :param logo
         :param registration_enabled boolean Whether the registration process is enabled.
-        :param registration_opening_datetime string The opening date of the registrations in RFC 3339 format (combined date, time and utc offset)
-        :param registration_closing_datetime string The closing date of the registrations in RFC 3339 format (combined date, time and utc offset)
+        :param registration_opening_datetime string The opening date of the registrations in RFC 3339 format (combined date, time and utc offset). The attribute is a timezone-aware datetime.
+        :param registration_closing_datetime string The closing date of the registrations in RFC 3339 format (combined date, time and utc offset). The attribute is a timezone-aware datetime.
         """
 
         self.id = int(id)
-        self.discipline = discipline
+        self.discipline = Converter.symbol(discipline)
         self.name = name
         self.full_name = full_name
-        self.status = status
-        self.scheduled_date_start = Converter.date(scheduled_date_start)
-        self.scheduled_date_end = Converter.date(scheduled_date_end)
-        self.timezone = timezone
+        self.status = Converter.symbol(status)
+        self.scheduled_date_start = converted(Converter.date, scheduled_date_start)
+        self.scheduled_date_end = converted(Converter.date, scheduled_date_end)
+        self.timezone = Converter.symbol(timezone)
         self.public = public
         self.size = size
         self.online = online
         self.location = location
         self.country = country
-        self.platforms = platforms
-        self.logo = TournamentLogo(**logo) if logo else None
+        self.platforms = Converter.symbols(platforms)
+        self.logo = nested(TournamentLogo, logo)
         self.registration_enabled = registration_enabled
-        self.registration_opening_datetime = Converter.datetime(registration_opening_datetime)
-        self.registration_closing_datetime = Converter.datetime(registration_closing_datetime)
+        self.registration_opening_datetime = converted(Converter.datetime, registration_opening_datetime)
+        self.registration_closing_datetime = converted(Converter.datetime, registration_closing_datetime)
 
 
 class TournamentDetailed(Tournament):
 
+    __slots__ = ('participant_type', 'organization', 'contact', 'discord', 'website', 'description', 'rules', 'prize',
+                 'settings')
+
     def __init__(self, *, participant_type, organization=None, contact=None, discord=None, website=None,
                  description=None, rules=None, prize=None, settings, **kwargs):
         """
@@ -623,7 +731,7 @@ class TournamentDetailed(Tournament):
 
         super().__init__(**kwargs)
 
-        self.participant_type = participant_type
+        self.participant_type = Converter.symbol(participant_type)
         self.organization = organization
         self.contact = contact
         self.discord = discord